@@ -0,0 +1,219 @@
+import numpy as np
+
+_BLOCK = 512  # произведение 512 мантисс из [0.5, 1) не выходит за пределы float64
+
+
+def _frexp_prod(values):
+    """
+    Произведение массива в виде мантиссы и показателя степени двойки: prod = m * 2^e.
+
+    Мантиссы сомножителей перемножаются блоками с нормализацией после
+    каждого блока, показатели складываются точно, поэтому результат
+    не переполняется и не теряет значимость при любом числе сомножителей.
+    """
+    mantissas, exponents = np.frexp(values)
+    m, e = 1.0, int(exponents.sum())
+    for start in range(0, len(mantissas), _BLOCK):
+        m *= np.prod(mantissas[start:start + _BLOCK])
+        m, shift = np.frexp(m)
+        e += int(shift)
+    return m, e
+
+
+def _frexp_weights(xs):
+    """
+    Барицентрические веса w_i = 1 / prod_{j != i}(xs[i] - xs[j]) по последней оси xs
+    в виде мантисс и показателей степени двойки: w_i = m_i * 2^e_i.
+
+    Для массива формы (..., k) веса вычисляются сразу для всех наборов узлов
+    за k проходов по массиву, память — O(xs.size).
+    """
+    xs = np.asarray(xs, dtype=float)
+    k = xs.shape[-1]
+    m = np.ones(xs.shape)
+    e = np.zeros(xs.shape, dtype=np.int64)
+    for j in range(k):
+        diff = xs - xs[..., j:j + 1]
+        diff[..., j] = 1.0
+        diff_m, diff_e = np.frexp(diff)
+        m *= diff_m
+        e += diff_e
+        if (j + 1) % _BLOCK == 0:
+            m, shift = np.frexp(m)
+            e += shift
+    m, shift = np.frexp(m)
+    return 1 / m, -(e + shift)
+
+
+def barycentric_weights(xs):
+    """
+    Барицентрические веса узлов xs (по последней оси), умноженные на общий множитель 2^p.
+
+    Множитель выбирается так, чтобы наибольший по модулю вес каждого набора
+    был порядка 1; во второй барицентрической формуле он сокращается,
+    поэтому веса не переполняются и не обращаются в ноль при любом числе узлов.
+
+    Входные параметры:
+    xs : узлы, массив (k,) или (..., k) — несколько наборов узлов
+
+    Возвращает:
+    массив весов той же формы, что и xs
+    """
+    m, e = _frexp_weights(xs)
+    return np.ldexp(m, e - e.max(axis=-1, keepdims=True))
+
+
+def barycentric_basis(x, xs, weights):
+    """
+    Значения базисных многочленов Лагранжа l_i(x) во второй барицентрической форме.
+
+    l_i(x) = (w_i / (x - xs[i])) / sum_j (w_j / (x - xs[j])); в узле xs[i] l_i = 1.
+
+    Входные параметры:
+    x       : точка или массив точек
+    xs      : узлы (k,) или свои узлы для каждой точки, массив x.shape + (k,)
+    weights : барицентрические веса той же формы, что и xs
+
+    Возвращает:
+    массив формы x.shape + (k,)
+    """
+    x = np.asarray(x, dtype=float)
+    diffs = x[..., None] - xs
+    exact = diffs == 0
+    diffs[exact] = 1.0
+    ratio = weights / diffs
+    hit = exact.any(axis=-1)
+    ratio[hit] = exact[hit]
+    return ratio / ratio.sum(axis=-1, keepdims=True)
+
+
+def barycentric_sum(x, xs, ys, weights):
+    """
+    Значение многочлена Лагранжа во второй барицентрической форме за O(n) на точку.
+
+    P(x) = sum(w_i * y_i / (x - x_i)) / sum(w_i / (x - x_i));
+    если x совпадает с узлом, возвращается значение в этом узле.
+
+    Входные параметры:
+    x       : точка или массив точек
+    xs      : узлы (n,)
+    ys      : значения (n,) или (n, m) для m функций на общих узлах
+    weights : барицентрические веса узлов
+
+    Возвращает:
+    массив формы x.shape + ys.shape[1:]
+    """
+    x = np.asarray(x, dtype=float)
+    shape = x.shape
+    x = x.ravel()
+    extra = (1,) * (ys.ndim - 1)
+    numerator = np.zeros(x.shape + ys.shape[1:])
+    denominator = np.zeros_like(x)
+    node_hit = np.full(x.shape, -1)
+    for i in range(len(xs)):
+        d = x - xs[i]
+        exact = d == 0
+        node_hit[exact] = i
+        d[exact] = 1.0
+        ratio = weights[i] / d
+        numerator += ratio.reshape(x.shape + extra) * ys[i]
+        denominator += ratio
+    hit = node_hit >= 0
+    # В узлах знаменатель может обратиться в ноль; там берутся значения в узлах
+    denominator[hit] = 1.0
+    total = numerator / denominator.reshape(x.shape + extra)
+    total[hit] = ys[node_hit[hit]]
+    return total.reshape(shape + ys.shape[1:])[()]
+
+
+class BarycentricInterpolant:
+    """
+    Многочлен Лагранжа в барицентрической форме.
+
+    P(x) = sum(w_i * y_i / (x - x_i)) / sum(w_i / (x - x_i)),
+    где w_i = 1 / prod_{j != i}(x_i - x_j) — барицентрические веса.
+
+    Веса вычисляются один раз, вычисление в точке выполняется за O(n),
+    добавление и удаление узла пересчитывает веса за O(n).
+    """
+
+    def __init__(self, xs=(), ys=()):
+        if len(xs) != len(ys):
+            raise ValueError("Количество x и y должно совпадать")
+        self.xs = np.empty(0)
+        self.ys = np.empty(0)
+        self.weights = np.empty(0)
+        # Веса хранятся как мантиссы и показатели степени двойки (w_i = m_i * 2^e_i):
+        # при большом числе узлов и очень широком или узком отрезке
+        # сами веса выходят за пределы float64
+        self._mantissas = np.empty(0)
+        self._exponents = np.empty(0, dtype=np.int64)
+        if len(xs):
+            xs = np.asarray(xs, dtype=float)
+            if len(np.unique(xs)) != len(xs):
+                raise ValueError("Узлы не должны совпадать")
+            self.xs = xs.copy()
+            self.ys = np.asarray(ys, dtype=float).copy()
+            self._set_weights(*_frexp_weights(self.xs))
+
+    def __len__(self):
+        return len(self.xs)
+
+    def _set_weights(self, mantissas, exponents):
+        """Нормализует мантиссы и пересчитывает веса для вычисления (максимум по модулю — порядка 1)"""
+        mantissas, shift = np.frexp(mantissas)
+        self._mantissas = mantissas
+        self._exponents = exponents + shift
+        if len(self._exponents):
+            # Общий множитель весов сокращается в барицентрической формуле
+            self.weights = np.ldexp(self._mantissas, self._exponents - self._exponents.max())
+        else:
+            self.weights = np.empty(0)
+
+    def add_node(self, x, y):
+        """
+        Добавляет узел (x, y) и пересчитывает веса за O(n).
+
+        Входные параметры:
+        x : координата нового узла
+        y : значение функции в новом узле
+        """
+        x = float(x)
+        diff = self.xs - x
+        if np.any(diff == 0):
+            raise ValueError("Узлы не должны совпадать")
+        # w_i /= (x_i - x); новый вес 1 / prod_j (x - x_j)
+        diff_m, diff_e = np.frexp(diff)
+        product_m, product_e = _frexp_prod(-diff)
+        self.xs = np.append(self.xs, x)
+        self.ys = np.append(self.ys, float(y))
+        self._set_weights(
+            np.append(self._mantissas / diff_m, 1.0 / product_m),
+            np.append(self._exponents - diff_e, -product_e),
+        )
+
+    def remove_node(self, index):
+        """
+        Удаляет узел с номером index и пересчитывает веса за O(n).
+
+        Входные параметры:
+        index : номер удаляемого узла
+        """
+        x = self.xs[index]
+        self.xs = np.delete(self.xs, index)
+        self.ys = np.delete(self.ys, index)
+        diff_m, diff_e = np.frexp(self.xs - x)
+        self._set_weights(
+            np.delete(self._mantissas, index) * diff_m,
+            np.delete(self._exponents, index) + diff_e,
+        )
+
+    def __call__(self, x):
+        """
+        Вычисляет значение многочлена в точке x (или массиве точек).
+
+        Если x совпадает с узлом, возвращается значение функции в этом узле.
+        """
+        if not len(self.xs):
+            raise ValueError("Нет узлов интерполяции")
+        return barycentric_sum(x, self.xs, self.ys, self.weights)
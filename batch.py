@@ -0,0 +1,73 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+from cache import default_cache
+from nodes import as_node_set
+from solve import METHODS, applicable_methods
+
+# Структурированный тип результата: по одному полю на метод, NaN — метод неприменим
+RESULT_DTYPE = np.dtype([(key, float) for key, _, _ in METHODS])
+
+
+def _solve_job(job):
+    """
+    Решение одной задачи пакета (выполняется в процессе-воркере).
+
+    Построенные интерполянты сохраняются в кэше процесса, поэтому задачи
+    с повторяющимися наборами узлов не строят таблицы заново.
+
+    Входные параметры:
+    job : кортеж (nodes, queries), nodes — NodeSet задачи
+
+    Возвращает:
+    одномерный структурированный массив RESULT_DTYPE длины len(queries)
+    """
+    nodes, queries = job
+    if nodes.has_duplicates:
+        raise ValueError("Узлы не должны совпадать")
+    result = np.empty(len(queries), dtype=RESULT_DTYPE)
+    for key in RESULT_DTYPE.names:
+        result[key] = np.nan
+    for key, _, interpolant_cls in applicable_methods(nodes.xs, nodes.n, nodes):
+        result[key] = default_cache.fit(interpolant_cls, nodes)(queries)
+    return result
+
+
+def solve_batch(xs_sets, ys_sets, queries, processes=None, chunksize=16):
+    """
+    Пакетное решение множества независимых задач интерполяции без построения графиков.
+
+    Входные параметры:
+    xs_sets   : список массивов узлов, двумерный массив (k, n) или список NodeSet
+    ys_sets   : список массивов значений, двумерный массив (k, n)
+                или None, если xs_sets — NodeSet со значениями
+    queries   : общий одномерный массив точек (q,) или двумерный массив (k, q) — свой для каждой задачи
+    processes : число процессов (None — по числу ядер, 0 — без пула, в текущем процессе)
+    chunksize : число задач, передаваемых воркеру за раз
+
+    Возвращает:
+    структурированный массив формы (k, q) с полями lagrange, newton_divided,
+    newton_finite, gauss, chebyshev; неприменимые к задаче методы заполнены NaN
+    """
+    if ys_sets is None:
+        ys_sets = [None] * len(xs_sets)
+    if len(xs_sets) != len(ys_sets):
+        raise ValueError("Количество наборов x и y должно совпадать")
+    queries = np.asarray(queries, dtype=float)
+    if queries.ndim == 1:
+        queries = np.broadcast_to(queries, (len(xs_sets), len(queries)))
+    if len(queries) != len(xs_sets):
+        raise ValueError("Количество наборов точек должно совпадать с количеством задач")
+
+    # Узлы каждой задачи сортируются здесь, методы выбираются по тому же NodeSet
+    jobs = [(as_node_set(xs, ys), np.asarray(q)) for xs, ys, q in zip(xs_sets, ys_sets, queries)]
+
+    if processes == 0:
+        rows = [_solve_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            rows = list(executor.map(_solve_job, jobs, chunksize=chunksize))
+
+    if not rows:
+        return np.empty((0, queries.shape[-1]), dtype=RESULT_DTYPE)
+    return np.stack(rows)
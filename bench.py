@@ -0,0 +1,183 @@
+"""
+Бенчмарк методов интерполяции.
+
+Замеряет время, пропускную способность, пиковую память и точность
+lagrange_polynomial, newton_divided_difference_polynomial,
+newton_finite_difference_polynomial, gauss_polynomial, divided_differences
+и finite_differences при разном числе узлов n и размере пакета точек.
+Результаты сохраняются в JSON; два файла можно сравнить флагом --compare.
+
+Примеры:
+    python bench.py --output bench.json
+    python bench.py --nodes 5 11 101 --queries 1 1000 --output new.json --compare bench.json
+"""
+import argparse
+from datetime import datetime, timezone
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+import numpy as np
+
+from solve import (
+    lagrange_polynomial,
+    newton_divided_difference_polynomial,
+    newton_finite_difference_polynomial,
+    gauss_polynomial,
+    divided_differences,
+    finite_differences,
+)
+
+# Тестовые функции (те же, что в генераторе данных приложения)
+FUNCTIONS = {
+    1: ("2x² - 5x", lambda x: 2 * x ** 2 - 5 * x),
+    2: ("x⁵", lambda x: x ** 5),
+    3: ("sin(x)", np.sin),
+    4: ("sqrt(x)", np.sqrt),
+}
+
+INTERPOLATORS = [
+    lagrange_polynomial,
+    newton_divided_difference_polynomial,
+    newton_finite_difference_polynomial,
+    gauss_polynomial,
+]
+
+TABLES = [divided_differences, finite_differences]
+
+
+def measure(call, repeat):
+    """
+    Замер одного вызова: минимальное время на вызов из repeat серий и пиковая память.
+
+    Число вызовов в серии подбирается timeit.Timer.autorange так, чтобы серия
+    длилась не меньше 0.2 с (подбор заодно прогревает кэши и аллокатор),
+    поэтому и быстрые вызовы измеряются с малым относительным шумом.
+
+    Возвращает:
+    seconds, number, peak_bytes, result
+    """
+    timer = timeit.Timer(call)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat, number)) / number
+
+    tracemalloc.start()
+    result = call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, number, peak, result
+
+
+def run_case(name, call, n, queries, repeat, exact=None):
+    record = {"function": name, "n": n, "queries": queries}
+    try:
+        seconds, number, peak, result = measure(call, repeat)
+    except Exception as e:
+        record.update(status="error", error=f"{type(e).__name__}: {e}")
+        return record
+    record.update(
+        status="ok",
+        seconds=seconds,
+        number=number,
+        # Для построения таблиц пропускная способность считается в узлах в секунду
+        throughput=(queries or n) / seconds if seconds > 0 else float("inf"),
+        peak_memory_bytes=peak,
+    )
+    if exact is not None:
+        error = np.max(np.abs(np.asarray(result, dtype=float) - exact))
+        record["max_error"] = float(error)
+    return record
+
+
+def run(nodes, query_sizes, function, a, b, repeat, max_work):
+    _, f = FUNCTIONS[function]
+    results = []
+    for n in nodes:
+        xs = np.linspace(a, b, n)
+        ys = f(xs)
+
+        for table in TABLES:
+            args = (xs, ys) if table is divided_differences else (ys,)
+            results.append(run_case(table.__name__, lambda: table(*args), n, 0, repeat))
+
+        for q in query_sizes:
+            x = np.linspace(a, b, q)
+            exact = f(x)
+            for method in INTERPOLATORS:
+                if n * q > max_work:
+                    results.append({"function": method.__name__, "n": n, "queries": q, "status": "skipped"})
+                    continue
+                results.append(run_case(method.__name__, lambda: method(xs, ys, n, x), n, q, repeat, exact))
+            print(f"n={n} q={q}", file=sys.stderr)
+    return results
+
+
+def compare(old_results, new_results, tolerance, noise_floor=0.0):
+    """
+    Сравнение двух прогонов: возвращает список строк о замедлениях больше tolerance (в долях).
+
+    Случаи, в которых оба замера быстрее noise_floor секунд на вызов, не сравниваются:
+    их время определяется накладными расходами вызова и шумом системы.
+    """
+    key = lambda r: (r["function"], r["n"], r["queries"])
+    old = {key(r): r for r in old_results if r.get("status") == "ok"}
+    regressions = []
+    for r in new_results:
+        prev = old.get(key(r))
+        if prev is None or r.get("status") != "ok":
+            continue
+        if max(prev["seconds"], r["seconds"]) < noise_floor:
+            continue
+        ratio = r["seconds"] / prev["seconds"] if prev["seconds"] > 0 else 1.0
+        if ratio > 1 + tolerance:
+            regressions.append(f"{r['function']} n={r['n']} q={r['queries']}: "
+                               f"{prev['seconds']:.6f}s -> {r['seconds']:.6f}s (x{ratio:.2f})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк методов интерполяции")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[5, 9, 51, 101, 1001, 10001])
+    parser.add_argument("--queries", type=int, nargs="+", default=[1, 100, 10000, 1000000])
+    parser.add_argument("--function", type=int, choices=sorted(FUNCTIONS), default=3)
+    parser.add_argument("--interval", type=float, nargs=2, default=[0.0, 1.0], metavar=("X0", "XN"))
+    parser.add_argument("--repeat", type=int, default=5, help="число серий замера (берётся лучшая)")
+    parser.add_argument("--max-work", type=float, default=1e9,
+                        help="пропускать сочетания с n * queries больше заданного")
+    parser.add_argument("--output", default="bench.json")
+    parser.add_argument("--compare", help="JSON предыдущего прогона для поиска регрессий")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="допустимое замедление относительно --compare (0.2 = 20%%)")
+    parser.add_argument("--noise-floor", type=float, default=1e-4,
+                        help="не сравнивать случаи быстрее заданного числа секунд на вызов")
+    args = parser.parse_args(argv)
+
+    results = run(args.nodes, args.queries, args.function, *args.interval, args.repeat, args.max_work)
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "function": FUNCTIONS[args.function][0],
+            "interval": args.interval,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"Результаты сохранены в {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            old = json.load(f)
+        regressions = compare(old["results"], results, args.tolerance, args.noise_floor)
+        for line in regressions:
+            print("Регрессия:", line)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+from collections import OrderedDict
+import hashlib
+import threading
+import numpy as np
+
+from nodes import NodeSet
+
+
+def _expand(arrays):
+    for a in arrays:
+        if isinstance(a, NodeSet):
+            yield a.xs
+            if a.ys is not None:
+                yield a.ys
+        else:
+            yield a
+
+
+def fingerprint(*arrays):
+    """
+    Отпечаток набора массивов: хэш BLAKE2 от формы и байтов каждого массива.
+
+    Входные параметры:
+    arrays : массивы или списки чисел (приводятся к float64) или NodeSet (его xs и ys)
+
+    Возвращает:
+    шестнадцатеричная строка
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for a in _expand(arrays):
+        a = np.ascontiguousarray(a, dtype=float)
+        h.update(str(a.shape).encode())
+        h.update(memoryview(a).cast("B"))
+    return h.hexdigest()
+
+
+def _nbytes(obj):
+    """
+    Объём массивов NumPy, на которые ссылается объект (через атрибуты, словари,
+    списки и кортежи на любой глубине).
+
+    Каждый массив учитывается один раз; для представления (view) учитывается
+    исходный массив, которому принадлежат данные.
+    """
+    total = 0
+    seen = set()
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if isinstance(item, np.ndarray):
+            if isinstance(item.base, np.ndarray):
+                stack.append(item.base)
+            else:
+                total += item.nbytes
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, "__dict__") and not isinstance(item, type):
+            stack.append(vars(item))
+    return total
+
+
+class InterpolantCache:
+    """
+    LRU-кэш построенных интерполянтов и таблиц разностей.
+
+    Ключ — модуль и имя класса (фабрики) и отпечаток входных массивов, поэтому повторный
+    запрос с теми же узлами пропускает построение таблиц коэффициентов.
+    Размер ограничивается числом записей maxsize и, при необходимости, суммарным
+    объёмом массивов max_bytes. Доступ потокобезопасен.
+    """
+
+    def __init__(self, maxsize=128, max_bytes=None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # ключ -> (объект, размер в байтах)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def fit(self, factory, *arrays, **kwargs):
+        """
+        Возвращает factory(*arrays, **kwargs) из кэша или строит и сохраняет его.
+
+        Входные параметры:
+        factory : класс интерполянта или таблицы (например, NewtonInterpolant, FiniteDifferenceTable)
+        arrays  : массивы, от которых зависит результат (xs, ys, только ys или NodeSet)
+        kwargs  : дополнительные параметры построения (входят в ключ)
+        """
+        key = (factory.__module__, factory.__qualname__, fingerprint(*arrays), tuple(sorted(kwargs.items())))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        obj = factory(*arrays, **kwargs)
+        size = _nbytes(obj)
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (obj, size)
+                self.current_bytes += size
+                self._evict()
+        return obj
+
+    def _evict(self):
+        while self._entries and (
+                len(self._entries) > self.maxsize
+                or (self.max_bytes is not None and self.current_bytes > self.max_bytes and len(self._entries) > 1)):
+            _, (_, size) = self._entries.popitem(last=False)
+            self.current_bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """Статистика кэша: попадания, промахи, вытеснения, число записей и объём"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# Общий кэш процесса
+default_cache = InterpolantCache()
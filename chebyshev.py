@@ -0,0 +1,159 @@
+import numpy as np
+
+from nodes import as_node_set
+
+
+def chebyshev_nodes(a, b, n, kind=1):
+    """
+    Узлы Чебышёва на отрезке [a, b] в порядке возрастания.
+
+    Входные параметры:
+    a, b : границы отрезка
+    n    : количество узлов
+    kind : 1 — корни T_n (концы отрезка не входят),
+           2 — экстремумы T_{n-1} (узлы Чебышёва–Лобатто, включают a и b)
+
+    Возвращает:
+    массив узлов длины n
+    """
+    if kind == 1:
+        t = np.cos(np.pi * (2 * np.arange(n) + 1) / (2 * n))
+    elif kind == 2:
+        if n < 2:
+            raise ValueError("Для узлов второго рода нужно как минимум 2 узла")
+        t = np.cos(np.pi * np.arange(n) / (n - 1))
+    else:
+        raise ValueError("Род узлов должен быть 1 или 2")
+    return (a + b) / 2 + (b - a) / 2 * t[::-1]
+
+
+def chebyshev_interval(xs, rtol=1e-9):
+    """
+    Распознаёт узлы Чебышёва: находит a, b и род, при которых xs = chebyshev_nodes(a, b, n, kind).
+
+    Входные параметры:
+    xs   : узлы по возрастанию (не менее 3)
+    rtol : допустимое отклонение узлов относительно длины отрезка
+
+    Возвращает:
+    кортеж (a, b, kind) или None, если xs — не узлы Чебышёва
+    """
+    xs = np.asarray(xs, dtype=float)
+    n = len(xs)
+    if n < 3:
+        return None
+    for kind in (1, 2):
+        # Крайние узлы — образы t = -cos(phi) и t = cos(phi) при x = c + r * t
+        edge = np.cos(np.pi / (2 * n)) if kind == 1 else 1.0
+        r = (xs[-1] - xs[0]) / (2 * edge)
+        c = (xs[-1] + xs[0]) / 2
+        if r <= 0:
+            return None
+        if np.all(np.abs(chebyshev_nodes(c - r, c + r, n, kind) - xs) <= rtol * 2 * r):
+            return c - r, c + r, kind
+    return None
+
+
+def clenshaw(coef, t):
+    """
+    Вычисление суммы sum(coef[k] * T_k(t)) по рекуррентной схеме Кленшоу.
+
+    Входные параметры:
+    coef : коэффициенты разложения по многочленам Чебышёва
+    t    : точка или массив точек на [-1, 1]
+
+    Возвращает:
+    значение суммы в точке t (массив той же формы, что и t)
+    """
+    t = np.asarray(t, dtype=float)
+    b1 = np.zeros_like(t)
+    b2 = np.zeros_like(t)
+    for c in coef[:0:-1]:
+        b1, b2 = c + 2 * t * b1 - b2, b1
+    return (coef[0] + t * b1 - b2)[()]
+
+
+def values_to_coefficients(values, kind=1):
+    """
+    Коэффициенты Чебышёва по значениям в узлах Чебышёва за O(n log n) (ДКП через БПФ).
+
+    Входные параметры:
+    values : значения функции в узлах chebyshev_nodes(-1, 1, n, kind) (по возрастанию x)
+    kind   : род узлов (1 или 2)
+
+    Возвращает:
+    массив коэффициентов c_0, ..., c_{n-1}
+    """
+    # Переходим к порядку по убыванию x, т. е. по возрастанию угла
+    values = np.asarray(values, dtype=float)[::-1]
+    n = len(values)
+    if kind == 1:
+        # ДКП-II через БПФ длины n: чётные отсчёты, затем нечётные в обратном порядке
+        v = np.concatenate([values[::2], values[1::2][::-1]])
+        spectrum = np.fft.fft(v)
+        shift = np.exp(-1j * np.pi * np.arange(n) / (2 * n))
+        coef = 2 / n * np.real(shift * spectrum)
+        coef[0] /= 2
+        return coef
+    if kind == 2:
+        if n == 1:
+            return values.copy()
+        # ДКП-I через БПФ чётного продолжения длины 2(n - 1)
+        v = np.concatenate([values, values[-2:0:-1]])
+        coef = np.real(np.fft.fft(v))[:n] / (n - 1)
+        coef[0] /= 2
+        coef[-1] /= 2
+        return coef
+    raise ValueError("Род узлов должен быть 1 или 2")
+
+
+class ChebyshevInterpolant:
+    """
+    Интерполяционный многочлен в базисе Чебышёва на отрезке [a, b].
+
+    Коэффициенты вычисляются по значениям в узлах Чебышёва через БПФ за O(n log n),
+    значение в точке — по схеме Кленшоу за O(n). В отличие от равноотстоящих узлов
+    не подвержен эффекту Рунге и устойчив при сотнях и тысячах узлов.
+    """
+
+    def __init__(self, values, a, b, kind=1):
+        """
+        Входные параметры:
+        values : значения функции в узлах chebyshev_nodes(a, b, len(values), kind)
+        a, b   : границы отрезка
+        kind   : род узлов (1 или 2)
+        """
+        self.a = float(a)
+        self.b = float(b)
+        self.kind = kind
+        self.coef = values_to_coefficients(values, kind)
+
+    @classmethod
+    def from_function(cls, f, a, b, n, kind=1):
+        """Строит интерполянт функции f (векторизованной по NumPy) по n узлам Чебышёва"""
+        xs = chebyshev_nodes(a, b, n, kind)
+        return cls(f(xs), a, b, kind)
+
+    def nodes(self):
+        return chebyshev_nodes(self.a, self.b, len(self.coef), self.kind)
+
+    def __call__(self, x):
+        t = (2 * np.asarray(x, dtype=float) - (self.a + self.b)) / (self.b - self.a)
+        return clenshaw(self.coef, t)
+
+
+class ChebyshevNodesInterpolant(ChebyshevInterpolant):
+    """
+    Интерполянт Чебышёва по готовому набору узлов (как у интерполянтов solve.METHODS).
+
+    Узлы должны быть узлами Чебышёва первого или второго рода на некотором
+    отрезке; отрезок и род определяются по самим узлам.
+    """
+
+    def __init__(self, xs, ys=None):
+        nodes = as_node_set(xs, ys)
+        interval = chebyshev_interval(nodes.xs)
+        if interval is None:
+            raise ValueError("Узлы не являются узлами Чебышёва")
+        a, b, kind = interval
+        super().__init__(nodes.ys, a, b, kind)
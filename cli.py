@@ -0,0 +1,147 @@
+"""
+Консольный запуск интерполяции без графического интерфейса и графиков.
+
+Обрабатывает один входной файл или каталог файлов (формат test1.txt или .npy),
+выбирает методы так же, как solve(), и выводит результаты в CSV или JSON.
+
+Примеры:
+    python cli.py test1.txt
+    python cli.py data/ --format csv --output results.csv --jobs 4
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from functools import partial
+import glob
+import json
+import os
+import sys
+
+from cache import default_cache
+from loader import load
+from nodes import NodeSet
+from profiling import active_profiler, profile, stage
+from solve import applicable_methods
+from stable import COMPENSATED_METHODS
+
+INPUT_EXTENSIONS = (".txt", ".npy")
+
+
+def process_file(filename, compensated=False):
+    """
+    Решение задачи интерполяции для одного файла.
+
+    При compensated=True многочлены Лагранжа и Ньютона вычисляются
+    в компенсированной арифметике (stable.py).
+
+    Возвращает:
+    словарь с ключами file, x, n, results ({ключ метода: значение}) или error
+    """
+    record = {"file": filename}
+    try:
+        with stage("load"):
+            x, xs, ys = load(filename)
+        with stage("dispatch"):
+            nodes = NodeSet(xs, ys)
+        if nodes.n < 2:
+            raise ValueError("Необходимо как минимум 2 узла")
+        if nodes.has_duplicates:
+            raise ValueError("Узлы не должны совпадать")
+
+        record.update(x=x, n=nodes.n, results={})
+        for key, _, interpolant_cls in applicable_methods(nodes.xs, nodes.n, nodes):
+            if compensated:
+                interpolant_cls = COMPENSATED_METHODS.get(key, interpolant_cls)
+            with stage(f"fit:{key}"):
+                interpolant = default_cache.fit(interpolant_cls, nodes)
+            with stage(f"evaluate:{key}"):
+                record["results"][key] = float(interpolant(x))
+    except Exception as e:
+        record["error"] = str(e)
+    return record
+
+
+def process_file_profiled(filename, compensated=False, track_memory=False):
+    """
+    process_file в процессе-воркере с собственным профилировщиком.
+
+    Возвращает:
+    (запись process_file, сводка профилировщика воркера)
+    """
+    with profile(track_memory) as profiler:
+        record = process_file(filename, compensated)
+    return record, profiler.summary()
+
+
+def collect_files(paths):
+    """Список входных файлов: сами файлы и файлы с подходящим расширением из каталогов"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(glob.glob(os.path.join(path, "*"))):
+                if os.path.isfile(name) and os.path.splitext(name)[1].lower() in INPUT_EXTENSIONS:
+                    files.append(name)
+        else:
+            files.append(path)
+    return files
+
+
+def write_json(records, out):
+    json.dump(records, out, ensure_ascii=False, indent=2)
+    out.write("\n")
+
+
+def write_csv(records, out):
+    """Одна строка на пару (файл, метод); для файлов с ошибкой — строка с полем error"""
+    writer = csv.writer(out)
+    writer.writerow(["file", "x", "n", "method", "value", "error"])
+    for record in records:
+        if "error" in record:
+            writer.writerow([record["file"], record.get("x", ""), record.get("n", ""), "", "", record["error"]])
+            continue
+        for key, value in record["results"].items():
+            writer.writerow([record["file"], record["x"], record["n"], key, repr(value), ""])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Интерполяция функций из файлов без графического интерфейса")
+    parser.add_argument("paths", nargs="+", help="входные файлы или каталоги")
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--output", help="файл результатов (по умолчанию — стандартный вывод)")
+    parser.add_argument("--jobs", type=int, default=1, help="число процессов (0 — по числу ядер)")
+    parser.add_argument("--compensated", action="store_true",
+                        help="компенсированная арифметика для многочленов высокой степени")
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.paths)
+    if not files:
+        parser.error("не найдено входных файлов")
+
+    profiler = active_profiler()
+    if args.jobs == 1:
+        records = [process_file(f, args.compensated) for f in files]
+    elif profiler is None:
+        with ProcessPoolExecutor(max_workers=args.jobs or None) as executor:
+            records = list(executor.map(partial(process_file, compensated=args.compensated), files))
+    else:
+        # Сводки профилировщиков воркеров собираются в профилировщике родительского процесса
+        process = partial(process_file_profiled, compensated=args.compensated,
+                          track_memory=profiler.track_memory)
+        with ProcessPoolExecutor(max_workers=args.jobs or None) as executor:
+            results = list(executor.map(process, files))
+        records = [record for record, _ in results]
+        for _, summary in results:
+            profiler.merge(summary)
+
+    write = write_json if args.format == "json" else write_csv
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as out:
+            write(records, out)
+    else:
+        write(records, sys.stdout)
+
+    return 1 if any("error" in r for r in records) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
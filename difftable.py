@@ -0,0 +1,97 @@
+import numpy as np
+
+
+class FiniteDifferenceTable:
+    """
+    Треугольная таблица конечных разностей в упакованном одномерном буфере.
+
+    Столбец k (разности порядка k, n - k значений) хранится подряд, начиная
+    со смещения offsets[k] = k * n - k * (k - 1) / 2. Всего n * (n + 1) / 2
+    элементов вместо n * n в матрице, каждый столбец строится одной
+    векторной операцией np.diff из предыдущего.
+
+    Для матрицы значений ys формы (n, m) (m функций на общих узлах) каждая
+    ячейка таблицы — вектор длины m, все столбцы обрабатываются одновременно.
+
+    Обозначения (y_i — значения в узлах):
+    forward(i, k)  = Δ^k y_i
+    backward(i, k) = ∇^k y_i = Δ^k y_{i-k}
+    central(i, k)  = разность порядка k с центром в узле i
+    """
+
+    def __init__(self, ys):
+        ys = np.asarray(ys, dtype=float)
+        n = len(ys)
+        self.n = n
+        k = np.arange(n)
+        self.offsets = k * n - k * (k - 1) // 2
+        self.buffer = np.empty((n * (n + 1) // 2,) + ys.shape[1:])
+        if n:
+            self.buffer[:n] = ys
+        for k in range(1, n):
+            prev = self.column(k - 1)
+            start = self.offsets[k]
+            np.subtract(prev[1:], prev[:-1], out=self.buffer[start:start + n - k])
+
+    def __len__(self):
+        return self.n
+
+    def column(self, k):
+        """Разности порядка k: Δ^k y_0, ..., Δ^k y_{n-k-1} (представление буфера без копирования)"""
+        start = self.offsets[k]
+        return self.buffer[start:start + self.n - k]
+
+    def row(self, i, max_order=None):
+        """Разности, начинающиеся в узле i: Δ^0 y_i, ..., Δ^{n-i-1} y_i (не выше порядка max_order)"""
+        count = self.n - i if max_order is None else min(self.n - i, max_order + 1)
+        return self.buffer[self.offsets[:count] + i]
+
+    def forward(self, i, k):
+        """Прямая разность Δ^k y_i"""
+        if not 0 <= i < self.n - k:
+            raise IndexError(f"Нет разности порядка {k} для узла {i}")
+        return self.buffer[self.offsets[k] + i]
+
+    def backward(self, i, k):
+        """Обратная разность ∇^k y_i = Δ^k y_{i-k}"""
+        return self.forward(i - k, k)
+
+    def central(self, i, k, right=False):
+        """
+        Центральная разность порядка k в узле i.
+
+        Для чётного k это Δ^k y_{i-k/2}. Для нечётного k центр разности лежит
+        между узлами: по умолчанию берётся левая разность Δ^k y_{i-(k+1)/2},
+        при right=True — правая Δ^k y_{i-(k-1)/2}.
+        """
+        shift = k // 2 if right else (k + 1) // 2
+        return self.forward(i - shift, k)
+
+    def __getitem__(self, i):
+        """Строка таблицы i (совместимость с обращением delta_y[i][k])"""
+        return self.row(i)
+
+
+def diagonal_differences(ys, index):
+    """
+    Отдельные разности Δ^k y_{index[k]} без построения всей таблицы.
+
+    Столбцы таблицы вычисляются по одному и сразу отбрасываются, поэтому
+    нужно O(n) памяти (и O(n^2) операций, как для всей таблицы).
+
+    Входные параметры:
+    ys    : значения в узлах, массив (n,) или (n, m)
+    index : номера узлов по порядкам разностей: массив (K,) или (K, s) для s
+            диагоналей сразу, K <= n; номер вне столбца k заменяется ближайшим
+
+    Возвращает:
+    массив формы index.shape + ys.shape[1:]
+    """
+    column = np.asarray(ys, dtype=float)
+    index = np.asarray(index)
+    result = np.empty(index.shape + column.shape[1:])
+    for k in range(len(index)):
+        if k:
+            column = np.diff(column, axis=0)
+        result[k] = column[np.clip(index[k], 0, len(column) - 1)]
+    return result
@@ -0,0 +1,197 @@
+"""
+Интерполяция на прямоугольных сетках в 2-D и 3-D (тензорное произведение).
+
+Вдоль каждой оси строятся одномерные базисные функции тем же методом,
+что и в solve.py (Лагранж, Ньютон по разделённым или конечным разностям),
+по окну из k ближайших узлов. Значение в точке — свёртка массива значений
+на сетке с весами осей:
+
+    P(x, y, z) = sum_{i,j,l} V[i, j, l] * w0_i(x) * w1_j(y) * w2_l(z)
+
+Для каждой точки нужны только k^d ячеек сетки, поэтому массив значений
+не копируется (подходит и np.load(..., mmap_mode="r")), а память
+на вычисление ограничена блоком из chunk точек.
+"""
+import numpy as np
+
+from barycentric import barycentric_basis, barycentric_weights
+from nodes import NodeSet
+from piecewise import find_segments, local_windows
+from solve import NewtonFiniteInterpolant, divided_differences, horner
+
+GRID_METHODS = ("lagrange", "newton_divided", "newton_finite")
+# Наибольшее окно для методов Ньютона: коэффициенты базисных многочленов растут
+# как 2^k, и при больших окнах ошибка округления превышает саму интерполяцию
+NEWTON_MAX_WINDOW = 16
+
+
+class AxisBasis:
+    """
+    Базисные функции интерполяции вдоль одной оси сетки.
+
+    Для каждого окна из k подряд идущих узлов заранее вычисляются
+    коэффициенты базисных многочленов (многочленов, равных 1 в одном узле
+    окна и 0 в остальных). В точке x возвращаются номера узлов окна
+    и значения базисных многочленов в x — веса свёртки.
+    """
+
+    def __init__(self, xs, k=4, method="lagrange"):
+        """
+        Входные параметры:
+        xs     : узлы оси (по возрастанию, без повторов)
+        k      : количество узлов в окне (None — все узлы оси, глобальный многочлен;
+                 для методов Ньютона — не более NEWTON_MAX_WINDOW узлов)
+        method : "lagrange", "newton_divided" или "newton_finite" (равноотстоящие узлы)
+        """
+        nodes = NodeSet(xs)
+        if nodes.n < 2:
+            raise ValueError("Необходимо как минимум 2 узла")
+        if not nodes.was_sorted or nodes.has_duplicates:
+            raise ValueError("Значения x должны быть отсортированы по возрастанию и не повторяться")
+        if method not in GRID_METHODS:
+            raise ValueError(f"Неизвестный метод: {method}")
+        if method == "newton_finite" and not nodes.uniform:
+            raise ValueError("Метод конечных разностей требует равноотстоящих узлов")
+
+        self.xs = nodes.xs
+        n = nodes.n
+        k = n if k is None else min(k, n)
+        if k < 2:
+            raise ValueError("Окно должно содержать как минимум 2 узла")
+        if method != "lagrange" and k > NEWTON_MAX_WINDOW:
+            raise ValueError(f"Для методов Ньютона окно должно содержать не более {NEWTON_MAX_WINDOW} узлов")
+        self.k = k
+        self.method = method
+
+        # Окна располагаются так же, как в piecewise.LocalInterpolant
+        self.starts, index = local_windows(n, k)
+        self.window_xs = self.xs[index]
+
+        identity = np.eye(k)
+        if method == "lagrange":
+            self.coef = barycentric_weights(self.window_xs)
+        elif method == "newton_divided":
+            # Разделённые разности единичных векторов: столбец i — базисный многочлен узла i
+            self.coef = np.array([divided_differences(w, identity) for w in self.window_xs])
+        else:
+            # В переменной t = (x - x_0) / h коэффициенты одинаковы для всех окон
+            self.h = nodes.h
+            self.coef = NewtonFiniteInterpolant(self.window_xs[0], identity).coef
+
+    def __call__(self, x):
+        """
+        Веса свёртки в точках x.
+
+        Возвращает:
+        index   : номера узлов окна, массив формы x.shape + (k,)
+        weights : значения базисных многочленов, массив той же формы
+        """
+        x = np.asarray(x, dtype=float)
+        start = self.starts[find_segments(self.xs, x)]
+        nodes = self.window_xs[start]
+
+        if self.method == "lagrange":
+            weights = barycentric_basis(x, nodes, self.coef[start])
+        elif self.method == "newton_divided":
+            coef = self.coef[start]  # x.shape + (k, k)
+            weights = coef[..., -1, :].copy()
+            for j in range(self.k - 2, -1, -1):
+                weights *= (x - nodes[..., j])[..., None]
+                weights += coef[..., j, :]
+        else:
+            t = (x - nodes[..., 0]) / self.h
+            weights = horner(self.coef, np.arange(self.k), t)
+
+        return start[..., None] + np.arange(self.k), weights
+
+    def matrix(self, x):
+        """Плотная матрица весов формы (len(x), n): строка — разложение значения в x по узлам оси"""
+        x = np.ravel(np.asarray(x, dtype=float))
+        index, weights = self(x)
+        result = np.zeros((len(x), len(self.xs)))
+        np.put_along_axis(result, index, weights, axis=1)
+        return result
+
+
+class GridInterpolant:
+    """
+    Тензорная интерполяция значений на прямоугольной сетке размерности d (обычно 2 или 3).
+
+    Вызов с массивом точек формы (..., d) собирает для каждой точки окно
+    из k^d ячеек и сворачивает его с весами осей; точки обрабатываются
+    блоками по chunk штук. Метод grid() вычисляет значения сразу на
+    декартовом произведении координат последовательной свёрткой по осям.
+    """
+
+    def __init__(self, axes, values, k=4, method="lagrange", chunk=4096):
+        """
+        Входные параметры:
+        axes   : последовательность из d массивов узлов по осям
+        values : массив значений формы (len(axes[0]), ..., len(axes[d-1]))
+                 (не копируется; может быть np.memmap)
+        k      : количество узлов окна по каждой оси (число, последовательность
+                 из d чисел или None — глобальный многочлен по всей оси;
+                 для методов Ньютона — не более NEWTON_MAX_WINDOW)
+        method : метод одномерной интерполяции (см. GRID_METHODS)
+        chunk  : количество точек, обрабатываемых за один проход
+        """
+        self.values = values if isinstance(values, np.ndarray) else np.asarray(values, dtype=float)
+        d = len(axes)
+        if self.values.ndim != d:
+            raise ValueError("Размерность массива значений должна совпадать с количеством осей")
+        if np.ndim(k) == 0:
+            k = [k] * d
+        self.axes = [AxisBasis(xs, k_axis, method) for xs, k_axis in zip(axes, k)]
+        if tuple(len(a.xs) for a in self.axes) != self.values.shape:
+            raise ValueError("Количество узлов по осям должно совпадать с формой массива значений")
+        self.chunk = chunk
+
+    def __call__(self, points):
+        """
+        Значения в точках.
+
+        Входные параметры:
+        points : массив формы (..., d) — координаты точек
+
+        Возвращает:
+        массив значений формы points.shape[:-1]
+        """
+        points = np.asarray(points, dtype=float)
+        d = len(self.axes)
+        if points.shape[-1] != d:
+            raise ValueError(f"Точки должны иметь {d} координат")
+        flat = points.reshape(-1, d)
+        result = np.empty(len(flat))
+
+        # Индексы для выборки окна: ось a занимает позицию a + 1 в (chunk, k_0, ..., k_{d-1})
+        expand = [(slice(None),) + tuple(slice(None) if b == a else None for b in range(d))
+                  for a in range(d)]
+        for lo in range(0, len(flat), self.chunk):
+            block = flat[lo:lo + self.chunk]
+            index, weights = zip(*(axis(block[:, a]) for a, axis in enumerate(self.axes)))
+            cells = self.values[tuple(i[e] for i, e in zip(index, expand))]
+            # Свёртка по последней оси окна, пока не останется одна точка на строку
+            for w in reversed(weights):
+                cells = np.einsum("p...k,pk->p...", cells, w)
+            result[lo:lo + len(block)] = cells
+        return result.reshape(points.shape[:-1])[()]
+
+    def grid(self, *coords):
+        """
+        Значения на декартовом произведении coords[0] x ... x coords[d-1].
+
+        Массив значений последовательно сворачивается с плотными матрицами
+        весов осей; первыми сворачиваются оси с наибольшим сокращением
+        размера, чтобы промежуточные массивы оставались малыми.
+
+        Возвращает:
+        массив формы (len(coords[0]), ..., len(coords[d-1]))
+        """
+        if len(coords) != len(self.axes):
+            raise ValueError(f"Необходимо {len(self.axes)} массива координат")
+        matrices = [axis.matrix(c) for axis, c in zip(self.axes, coords)]
+        order = sorted(range(len(matrices)), key=lambda a: matrices[a].shape[0] / matrices[a].shape[1])
+        result = self.values
+        for a in order:
+            result = np.moveaxis(np.tensordot(result, matrices[a], axes=([a], [1])), -1, a)
+        return result
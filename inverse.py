@@ -0,0 +1,106 @@
+import numpy as np
+
+from solve import NewtonInterpolant
+
+
+def inverse_interpolate(xs, ys, targets):
+    """
+    Обратная интерполяция: x как многочлен Ньютона от y для монотонных данных.
+
+    Входные параметры:
+    xs      : массив координат узлов
+    ys      : массив значений функции в узлах (строго монотонный)
+    targets : значение или массив значений y, для которых ищется x
+
+    Возвращает:
+    x, при котором функция принимает значения targets (массив той же формы)
+    """
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    steps = np.diff(ys)
+    if not (np.all(steps > 0) or np.all(steps < 0)):
+        raise ValueError("Для обратной интерполяции значения y должны быть строго монотонны")
+    return NewtonInterpolant(ys, xs)(targets)
+
+
+def find_roots(f, xs, targets=0.0, tol=1e-12, maxiter=100, refine=1):
+    """
+    Поиск всех x, при которых интерполянт f принимает значения targets.
+
+    Отрезки с корнями выделяются по смене знака f(x) - y между соседними
+    отсортированными узлами (каждый отрезок можно разбить на refine частей).
+    Во всех отрезках для всех значений y одновременно выполняется метод Ньютона
+    с производной из формы Ньютона (если у f есть value_and_derivative),
+    шаг, выходящий за отрезок, заменяется делением пополам. Без производной
+    используется метод ложного положения, чередующийся с делением пополам.
+    Корни чётной кратности без смены знака не находятся.
+
+    Входные параметры:
+    f       : интерполянт (вызываемый объект, векторизованный по x)
+    xs      : отсортированные узлы — границы отрезков поиска
+    targets : значение или массив значений y
+    tol     : точность по x
+    maxiter : наибольшее число итераций
+    refine  : число частей, на которые делится каждый отрезок между узлами
+
+    Возвращает:
+    index : номера значений y (в развёрнутом массиве targets), к которым относятся корни
+    roots : найденные корни, упорядоченные по index, затем по x
+    """
+    xs = np.asarray(xs, dtype=float)
+    targets = np.atleast_1d(np.asarray(targets, dtype=float)).ravel()
+    if refine > 1:
+        grid = np.linspace(0, 1, refine + 1)[:-1]
+        xs = np.append((xs[:-1, None] + np.diff(xs)[:, None] * grid).ravel(), xs[-1])
+
+    # g[i, j] = f(xs[j]) - targets[i]
+    g = f(xs)[None, :] - targets[:, None]
+
+    exact_i, exact_j = np.nonzero(g == 0)
+    bracket_i, bracket_j = np.nonzero(g[:, :-1] * g[:, 1:] < 0)
+
+    lo = xs[bracket_j]
+    hi = xs[bracket_j + 1]
+    g_lo = g[bracket_i, bracket_j]
+    y = targets[bracket_i]
+    x = (lo + hi) / 2
+    has_derivative = hasattr(f, "value_and_derivative")
+    active = np.ones(len(x), dtype=bool)
+
+    for iteration in range(maxiter):
+        if not np.any(active):
+            break
+        xa, ya = x[active], y[active]
+        if has_derivative:
+            value, derivative = f.value_and_derivative(xa)
+            gx = value - ya
+            with np.errstate(divide="ignore", invalid="ignore"):
+                candidate = xa - gx / derivative
+        else:
+            gx = f(xa) - ya
+            g_hi = f(hi[active]) - ya
+            with np.errstate(divide="ignore", invalid="ignore"):
+                candidate = hi[active] - g_hi * (hi[active] - lo[active]) / (g_hi - g_lo[active])
+            if iteration % 2:
+                candidate = (lo[active] + hi[active]) / 2
+
+        # Сужение отрезка по знаку f(x) - y
+        same = np.sign(gx) == np.sign(g_lo[active])
+        new_lo = np.where(same, xa, lo[active])
+        new_hi = np.where(same, hi[active], xa)
+        new_g_lo = np.where(same, gx, g_lo[active])
+
+        outside = ~((candidate > new_lo) & (candidate < new_hi))
+        candidate = np.where(outside, (new_lo + new_hi) / 2, candidate)
+
+        done = (np.abs(candidate - xa) <= tol * (1 + np.abs(xa))) | (gx == 0)
+        candidate = np.where(gx == 0, xa, candidate)
+
+        lo[active], hi[active], g_lo[active] = new_lo, new_hi, new_g_lo
+        x[active] = candidate
+        active[np.flatnonzero(active)[done]] = False
+
+    index = np.concatenate([exact_i, bracket_i])
+    roots = np.concatenate([xs[exact_j], x])
+    order = np.lexsort((roots, index))
+    return index[order], roots[order]
@@ -0,0 +1,123 @@
+from itertools import islice
+import io
+import os
+import numpy as np
+
+
+def _parse_number(num_str):
+    """Преобразует строку в число, поддерживая и точку, и запятую"""
+    try:
+        return float(num_str.replace(',', '.'))
+    except ValueError:
+        raise ValueError(f"Некорректное число: '{num_str}'")
+
+
+def parse_pairs(lines):
+    """
+    Разбор строк вида "x y" в массивы NumPy.
+
+    Сначала весь блок разбирается одним вызовом np.loadtxt после замены
+    запятых на точки. Если в блоке есть строки другого вида, выполняется
+    построчный разбор, в котором такие строки пропускаются.
+
+    Входные параметры:
+    lines : список строк
+
+    Возвращает:
+    xs, ys : массивы узлов и значений
+    """
+    text = "".join(lines).replace(',', '.')
+    try:
+        data = np.loadtxt(io.StringIO(text), dtype=float, ndmin=2)
+        if data.shape[1] == 2:
+            return data[:, 0].copy(), data[:, 1].copy()
+    except ValueError:
+        pass
+
+    xs, ys = [], []
+    for line in lines:
+        parts = line.split()
+        if len(parts) == 2:
+            xs.append(_parse_number(parts[0]))
+            ys.append(_parse_number(parts[1]))
+    return np.array(xs, dtype=float), np.array(ys, dtype=float)
+
+
+def iter_text_chunks(filename, chunk_rows=100000):
+    """
+    Потоковое чтение текстового файла с узлами блоками по chunk_rows строк.
+
+    Формат файла: в первой строке точка интерполяции x, далее пары "x y".
+
+    Возвращает (генератор):
+    первым элементом — точку интерполяции x, затем кортежи (xs, ys) для каждого блока
+    """
+    with open(filename, 'r') as f:
+        first = f.readline().strip()
+        if not first:
+            raise ValueError("Нет точки интерполяции")
+        yield _parse_number(first)
+        while True:
+            lines = list(islice(f, chunk_rows))
+            if not lines:
+                break
+            xs, ys = parse_pairs(lines)
+            if len(xs):
+                yield xs, ys
+
+
+def load_text(filename, chunk_rows=100000):
+    """
+    Загрузка текстового файла с узлами в массивы NumPy.
+
+    Возвращает:
+    x, xs, ys : точка интерполяции, узлы и значения
+    """
+    chunks = iter_text_chunks(filename, chunk_rows)
+    x = next(chunks)
+    parts = list(chunks)
+    if not parts:
+        raise ValueError("Нет данных")
+    xs = np.concatenate([p[0] for p in parts])
+    ys = np.concatenate([p[1] for p in parts])
+    return x, xs, ys
+
+
+def save_binary(filename, x, xs, ys):
+    """
+    Сохранение узлов в двоичном формате .npy.
+
+    Хранится массив формы (2, n + 1): нулевой столбец — (x, nan),
+    далее строка 0 — узлы, строка 1 — значения. Строки непрерывны в памяти,
+    поэтому при загрузке через отображение файла xs и ys не копируются.
+    """
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    data = np.empty((2, len(xs) + 1))
+    data[:, 0] = (x, np.nan)
+    data[0, 1:] = xs
+    data[1, 1:] = ys
+    np.save(filename, data)
+
+
+def load_binary(filename, mmap=True):
+    """
+    Загрузка узлов из файла .npy, записанного save_binary.
+
+    Входные параметры:
+    mmap : отображать файл в память (без чтения и копирования данных)
+
+    Возвращает:
+    x, xs, ys : точка интерполяции и представления узлов и значений (только для чтения при mmap)
+    """
+    data = np.load(filename, mmap_mode='r' if mmap else None)
+    if data.ndim != 2 or data.shape[0] != 2 or data.shape[1] < 2:
+        raise ValueError("Некорректный формат двоичного файла")
+    return float(data[0, 0]), data[0, 1:], data[1, 1:]
+
+
+def load(filename, mmap=True):
+    """Загрузка узлов из текстового или двоичного (.npy) файла по расширению"""
+    if os.path.splitext(filename)[1].lower() == ".npy":
+        return load_binary(filename, mmap)
+    return load_text(filename)
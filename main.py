@@ -2,13 +2,31 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from math import sin, sqrt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from concurrent.futures import ThreadPoolExecutor
 import os
 import locale
+import queue
+import threading
 
-from solve import solve
+from solve import solve, iter_finite_differences_rows, export_finite_differences
+from difftable import FiniteDifferenceTable
+from cache import default_cache
+from plots import PlotView
+from chebyshev import chebyshev_nodes
+from loader import load
+from nodes import NodeSet
+
+
+class SolveCancelled(Exception):
+    """Вычисление отменено пользователем"""
 
 
 class InterpolationApp:
+    POLL_INTERVAL = 100  # мс, период опроса фонового вычисления
+    TABLE_PREVIEW_ROWS = 20  # строк таблицы разностей в логе
+    TABLE_PREVIEW_ORDERS = 10  # порядков разностей в логе и в окне таблицы по умолчанию
+    TABLE_PAGE_ROWS = 50  # строк на странице окна таблицы
+
     def __init__(self, root):
         self.root = root
         self.root.title("Лабораторная: Интерполяция функций")
@@ -22,8 +40,19 @@ class InterpolationApp:
         self.ys = []
         self.figures = []
         self.current_figure_index = 0
+        self.table = None  # таблица конечных разностей последнего решения
+        # Единственная фигура и холст для всех графиков, создаются при первом показе
+        self.plot_view = None
+        self.canvas = None
+
+        # Фоновое вычисление: результат забирается из главного цикла Tk через after
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.future = None
+        self.cancel_event = None
+        self.progress_queue = queue.Queue()
 
         self.create_widgets()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def parse_number(self, num_str):
         """Преобразует строку в число, поддерживая и точку, и запятую"""
@@ -54,18 +83,40 @@ class InterpolationApp:
             ("Сгенерировать по функции", self.generate_function)
         ]
 
+        # Во время решения кнопки данных отключаются: новые данные не смешиваются с идущим решением
+        self.data_buttons = []
         for i, (text, command) in enumerate(buttons):
             btn = tk.Button(control_frame, text=text, command=command)
             btn.grid(row=0, column=i, padx=5, sticky="ew")
+            self.data_buttons.append(btn)
+
+        # Кнопки решения и отмены
+        action_frame = tk.Frame(self.root)
+        action_frame.pack(pady=(0, 15))
 
-        # Кнопка решения
         self.solve_btn = tk.Button(
-            self.root,
+            action_frame,
             text="Решить и Построить графики",
             command=self.process,
             state=tk.DISABLED
         )
-        self.solve_btn.pack(pady=(0, 15))
+        self.solve_btn.pack(side=tk.LEFT, padx=5)
+
+        self.cancel_btn = tk.Button(
+            action_frame,
+            text="Отмена",
+            command=self.cancel_process,
+            state=tk.DISABLED
+        )
+        self.cancel_btn.pack(side=tk.LEFT, padx=5)
+
+        self.table_btn = tk.Button(
+            action_frame,
+            text="Таблица разностей",
+            command=self.show_table_window,
+            state=tk.DISABLED
+        )
+        self.table_btn.pack(side=tk.LEFT, padx=5)
 
         # Лог действий
         self.log_text = tk.Text(
@@ -114,29 +165,39 @@ class InterpolationApp:
         self.log_text.insert(tk.END, text + "\n")
         self.log_text.see(tk.END)
 
+    def data_changed(self):
+        """Новые данные: можно решать, таблица прошлого решения больше не соответствует данным"""
+        if self.future is not None:
+            # Данные сменились из окна, открытого до начала решения: решение по старым
+            # данным отменяется, а его результат не показывается (см. poll_solve)
+            self.cancel_event.set()
+            self.future = None
+            self.cancel_btn.config(state=tk.DISABLED)
+            self.set_data_buttons(tk.NORMAL)
+            self.log("Данные изменены, решение по прежним данным отменено")
+        self.table = None
+        self.table_btn.config(state=tk.DISABLED)
+        self.solve_btn.config(state=tk.NORMAL)
+
+    def set_data_buttons(self, state):
+        for btn in self.data_buttons:
+            btn.config(state=state)
+
     def load_from_file(self):
         """Загружает данные из файла"""
-        filename = filedialog.askopenfilename(filetypes=[("Text Files", "*.txt")])
+        filename = filedialog.askopenfilename(filetypes=[("Text Files", "*.txt"), ("NumPy Files", "*.npy")])
         if not filename:
             return
         try:
-            with open(filename, 'r') as f:
-                lines = f.readlines()
-
-            self.x = self.parse_number(lines[0].strip())
-            self.xs, self.ys = [], []
-            for line in lines[1:]:
-                if line.strip():
-                    parts = line.strip().split()
-                    if len(parts) == 2:
-                        self.xs.append(self.parse_number(parts[0]))
-                        self.ys.append(self.parse_number(parts[1]))
+            x, xs, ys = load(filename)
+            self.x = x
+            self.xs, self.ys = xs.tolist(), ys.tolist()
 
             if not self.xs:
                 raise ValueError("Нет данных")
 
             self.log(f"Данные успешно загружены из файла: {os.path.basename(filename)}")
-            self.solve_btn.config(state=tk.NORMAL)
+            self.data_changed()
         except Exception as e:
             messagebox.showerror("Ошибка", f"Ошибка при чтении файла: {e}")
 
@@ -277,16 +338,18 @@ class InterpolationApp:
             if len(self.xs) < 2:
                 raise ValueError("Необходимо ввести как минимум 2 точки")
 
+            nodes = NodeSet(self.xs)
+
             # Проверяем уникальность x
-            if len(set(self.xs)) != len(self.xs):
+            if nodes.has_duplicates:
                 raise ValueError("Значения x не должны повторяться")
 
             # Проверяем сортировку
-            if self.xs != sorted(self.xs):
+            if not nodes.was_sorted:
                 raise ValueError("Значения x должны быть отсортированы по возрастанию")
 
             self.log("Данные успешно введены вручную")
-            self.solve_btn.config(state=tk.NORMAL)
+            self.data_changed()
             self.manual_window.destroy()
 
         except ValueError as e:
@@ -300,7 +363,7 @@ class InterpolationApp:
         self.xs = [1.1, 1.25, 1.4, 1.55, 1.7, 1.85, 2]
         self.ys = [0.2234, 1.2438, 2.2644, 3.2984, 4.3222, 5.3516, 6.3867]
         self.log("Загружен пример")
-        self.solve_btn.config(state=tk.NORMAL)
+        self.data_changed()
 
     def generate_function(self):
         """Генерирует данные по выбранной функции"""
@@ -324,12 +387,15 @@ class InterpolationApp:
                 else:
                     raise ValueError("Неверный выбор функции")
 
-                h = (xn - x0) / (n - 1)
-                self.xs = [x0 + h * i for i in range(n)]
+                if nodes_var.get() == 1:
+                    h = (xn - x0) / (n - 1)
+                    self.xs = [x0 + h * i for i in range(n)]
+                else:
+                    self.xs = [float(x) for x in chebyshev_nodes(x0, xn, n)]
                 self.ys = [f(x) for x in self.xs]
 
                 self.log("Сгенерированы данные по функции")
-                self.solve_btn.config(state=tk.NORMAL)
+                self.data_changed()
                 popup.destroy()
             except Exception as e:
                 messagebox.showerror("Ошибка", f"Ошибка генерации: {e}")
@@ -343,6 +409,11 @@ class InterpolationApp:
         for i, func in enumerate(funcs, 1):
             tk.Radiobutton(popup, text=func, variable=func_var, value=i).pack(anchor='w')
 
+        tk.Label(popup, text="Расположение узлов:").pack()
+        nodes_var = tk.IntVar(value=1)
+        for i, text in enumerate(["Равноотстоящие", "Узлы Чебышёва"], 1):
+            tk.Radiobutton(popup, text=text, variable=nodes_var, value=i).pack(anchor='w')
+
         for label_text, entry_default in [("Число узлов:", "5"), ("x0:", "0.0"), ("xn:", "1.0"),
                                           ("x (точка интерполяции):", "0.5")]:
             tk.Label(popup, text=label_text).pack()
@@ -361,20 +432,25 @@ class InterpolationApp:
         tk.Button(popup, text="ОК", command=on_ok).pack(pady=10)
 
     def clear_plot_frame(self):
-        """Очищает фрейм с графиком"""
-        for widget in self.plot_frame.winfo_children():
-            widget.destroy()
+        """Очищает область графика (холст сохраняется для повторного использования)"""
+        if self.plot_view is not None:
+            self.plot_view.clear()
+            self.canvas.draw_idle()
 
     def show_current_figure(self):
         """Отображает текущий график"""
-        self.clear_plot_frame()
-
         if not self.figures:
+            self.clear_plot_frame()
             return
 
-        canvas = FigureCanvasTkAgg(self.figures[self.current_figure_index], master=self.plot_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, pady=10)
+        if self.canvas is None:
+            self.plot_view = PlotView()
+            self.canvas = FigureCanvasTkAgg(self.plot_view.figure, master=self.plot_frame)
+            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, pady=10)
+
+        # Кривая метода вычисляется при первом показе и кэшируется в PlotCurve
+        self.plot_view.show(self.figures[self.current_figure_index])
+        self.canvas.draw_idle()
 
         self.figure_label.config(text=f"График {self.current_figure_index + 1} из {len(self.figures)}")
 
@@ -395,22 +471,24 @@ class InterpolationApp:
 
     def process(self):
         """Обрабатывает данные и строит графики"""
+        if self.future is not None and not self.future.done():
+            return
+
         if not self.xs or not self.ys:
             messagebox.showerror("Ошибка", "Нет данных для обработки")
             return
 
-        if len(set(self.xs)) != len(self.xs):
+        nodes = NodeSet(self.xs, self.ys)
+        if nodes.has_duplicates:
             messagebox.showerror("Ошибка", "Узлы не должны совпадать")
             return
 
         self.log_text.delete("1.0", tk.END)
 
         # Проверка сортировки и автоматическая сортировка
-        if self.xs != sorted(self.xs):
-            combined = sorted(zip(self.xs, self.ys))
-            self.xs, self.ys = zip(*combined)
-            self.xs = list(self.xs)
-            self.ys = list(self.ys)
+        if not nodes.was_sorted:
+            self.xs = nodes.xs.tolist()
+            self.ys = nodes.ys.tolist()
             self.log("Узлы были неотсортированы. Выполнена автоматическая сортировка по x.")
 
         self.clear_plot_frame()
@@ -419,22 +497,153 @@ class InterpolationApp:
 
         self.log("Выполнение интерполяции...\n")
 
-        try:
-            result_text, figures = solve(self.xs, self.ys, self.x, len(self.xs), return_plots=True)
-            self.log(result_text)
-
-            self.figures = figures
-            if self.figures:
-                self.show_current_figure()
-                if len(self.figures) > 1:
-                    self.prev_btn.config(state=tk.NORMAL)
-                    self.next_btn.config(state=tk.NORMAL)
-                else:
-                    self.prev_btn.config(state=tk.DISABLED)
-                    self.next_btn.config(state=tk.DISABLED)
+        self.solve_btn.config(state=tk.DISABLED)
+        self.table_btn.config(state=tk.DISABLED)
+        self.set_data_buttons(tk.DISABLED)
+        self.cancel_btn.config(state=tk.NORMAL)
+        self.cancel_event = threading.Event()
+        self.future = self.executor.submit(self.run_solve, nodes, self.x, self.cancel_event)
+        self.root.after(self.POLL_INTERVAL, self.poll_solve, self.future)
+
+    def run_solve(self, nodes, x, cancel_event):
+        """Выполняется в фоновом потоке: только вычисления, без обращения к Tk"""
+
+        def progress(message):
+            if cancel_event.is_set():
+                raise SolveCancelled()
+            self.progress_queue.put((cancel_event, message))
+
+        # Полная таблица доступна постранично в отдельном окне, в лог — только начало
+        result_text, figures = solve(nodes.xs, nodes.ys, x, nodes.n, return_plots=True, progress=progress,
+                                     cache=default_cache, table_rows=self.TABLE_PREVIEW_ROWS,
+                                     table_orders=self.TABLE_PREVIEW_ORDERS, nodes=nodes)
+        # Таблица этого решения (из кэша, построена в solve) — для окна таблицы
+        table = default_cache.fit(FiniteDifferenceTable, nodes.ys)
+        return result_text, figures, table
+
+    def drain_progress(self):
+        """Переносит сообщения о ходе текущего вычисления в лог (сообщения отменённых отбрасываются)"""
+        while True:
+            try:
+                cancel_event, message = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            if cancel_event is self.cancel_event:
+                self.log(message)
+
+    def poll_solve(self, future):
+        """Опрашивает фоновое вычисление future из главного цикла Tk"""
+        if future is not self.future:
+            # Решение отменено сменой данных: его результат не показывается
+            return
+        self.drain_progress()
+        if not future.done():
+            self.root.after(self.POLL_INTERVAL, self.poll_solve, future)
+            return
+
+        self.future = None
+        self.solve_btn.config(state=tk.NORMAL)
+        self.cancel_btn.config(state=tk.DISABLED)
+        self.set_data_buttons(tk.NORMAL)
 
+        try:
+            result_text, figures, self.table = future.result()
+        except SolveCancelled:
+            self.log("Вычисление отменено")
+            return
         except Exception as e:
             messagebox.showerror("Ошибка", f"Ошибка решения: {e}")
+            return
+
+        self.log("")
+        self.log(result_text)
+        self.table_btn.config(state=tk.NORMAL)
+
+        self.figures = figures
+        if self.figures:
+            self.show_current_figure()
+            if len(self.figures) > 1:
+                self.prev_btn.config(state=tk.NORMAL)
+                self.next_btn.config(state=tk.NORMAL)
+            else:
+                self.prev_btn.config(state=tk.DISABLED)
+                self.next_btn.config(state=tk.DISABLED)
+
+    def show_table_window(self):
+        """Постраничный просмотр и экспорт таблицы конечных разностей последнего решения"""
+        table = self.table
+        if table is None:
+            return
+        pages = max(1, -(-len(table) // self.TABLE_PAGE_ROWS))
+        state = {"page": 0}
+
+        window = tk.Toplevel(self.root)
+        window.title("Таблица конечных разностей")
+        window.geometry("800x600")
+
+        top = tk.Frame(window, padx=10, pady=5)
+        top.pack(fill=tk.X)
+        tk.Label(top, text="Наибольший порядок:").pack(side=tk.LEFT)
+        order_var = tk.IntVar(value=min(self.TABLE_PREVIEW_ORDERS, len(table) - 1))
+        tk.Spinbox(top, from_=0, to=max(len(table) - 1, 0), width=6, textvariable=order_var,
+                   command=lambda: render()).pack(side=tk.LEFT, padx=5)
+
+        text = tk.Text(window, wrap=tk.NONE, font=('Courier', 10))
+        text.pack(fill=tk.BOTH, expand=True, padx=10)
+
+        nav = tk.Frame(window, pady=5)
+        nav.pack(fill=tk.X)
+        prev_btn = tk.Button(nav, text="← Предыдущая", command=lambda: turn(-1))
+        prev_btn.pack(side=tk.LEFT, padx=5)
+        next_btn = tk.Button(nav, text="Следующая →", command=lambda: turn(1))
+        next_btn.pack(side=tk.LEFT, padx=5)
+        page_label = tk.Label(nav)
+        page_label.pack(side=tk.LEFT, padx=10)
+        tk.Button(nav, text="Экспорт...", command=lambda: export()).pack(side=tk.RIGHT, padx=5)
+
+        def render():
+            # В виджет вставляется только текущая страница
+            start = state["page"] * self.TABLE_PAGE_ROWS
+            rows = iter_finite_differences_rows(table, start, start + self.TABLE_PAGE_ROWS, order_var.get())
+            text.delete("1.0", tk.END)
+            text.insert(tk.END, "\n".join(rows))
+            page_label.config(text=f"Страница {state['page'] + 1} из {pages}")
+            prev_btn.config(state=tk.NORMAL if state["page"] > 0 else tk.DISABLED)
+            next_btn.config(state=tk.NORMAL if state["page"] < pages - 1 else tk.DISABLED)
+
+        def turn(step):
+            state["page"] = min(max(state["page"] + step, 0), pages - 1)
+            render()
+
+        def export():
+            filename = filedialog.asksaveasfilename(
+                parent=window,
+                defaultextension=".csv",
+                filetypes=[("CSV", "*.csv"), ("NumPy", "*.npz")]
+            )
+            if not filename:
+                return
+            try:
+                export_finite_differences(table, filename, order_var.get())
+                self.log(f"Таблица разностей сохранена в файл: {os.path.basename(filename)}")
+            except Exception as e:
+                messagebox.showerror("Ошибка", f"Ошибка при сохранении таблицы: {e}", parent=window)
+
+        render()
+
+    def cancel_process(self):
+        """Запрашивает отмену фонового вычисления"""
+        if self.cancel_event is not None and self.future is not None and not self.future.done():
+            self.cancel_event.set()
+            self.cancel_btn.config(state=tk.DISABLED)
+            self.log("Отмена вычисления...")
+
+    def on_close(self):
+        """Закрывает окно, не дожидаясь фонового вычисления"""
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+import numpy as np
+
+
+class NodeSet:
+    """
+    Проверенный набор узлов интерполяции.
+
+    Все проверки выполняются векторно за один проход по массивам NumPy,
+    результат переиспользуется при выборе и построении методов.
+
+    Атрибуты:
+    xs, ys         : узлы и значения, отсортированные по возрастанию x
+    n              : количество узлов
+    was_sorted     : были ли узлы отсортированы изначально
+    order          : перестановка, сортирующая исходные узлы (None, если сортировка не нужна)
+    has_duplicates : есть ли совпадающие x
+    uniform        : равноотстоящие ли узлы (с относительной точностью rtol)
+    h              : средний шаг (xs[-1] - xs[0]) / (n - 1)
+    """
+
+    def __init__(self, xs, ys=None, rtol=1e-5):
+        xs = np.asarray(xs, dtype=float)
+        ys = None if ys is None else np.asarray(ys, dtype=float)
+        if ys is not None and len(ys) != len(xs):
+            raise ValueError("Количество x и y должно совпадать")
+
+        steps = np.diff(xs)
+        self.was_sorted = bool(np.all(steps >= 0))
+        self.order = None
+        if not self.was_sorted:
+            self.order = np.argsort(xs, kind="stable")
+            xs = xs[self.order]
+            ys = None if ys is None else ys[self.order]
+            steps = np.diff(xs)
+
+        self.xs = xs
+        self.ys = ys
+        self.n = len(xs)
+        self.has_duplicates = bool(np.any(steps == 0))
+        self.h = (xs[-1] - xs[0]) / (self.n - 1) if self.n > 1 else 0.0
+        self.uniform = bool(
+            self.n > 1 and self.h != 0 and np.all(np.abs(steps - self.h) <= rtol * abs(self.h))
+        )
+
+
+def as_node_set(xs, ys=None):
+    """NodeSet для узлов xs и значений ys; готовый NodeSet возвращается без изменений"""
+    if isinstance(xs, NodeSet):
+        return xs
+    return NodeSet(xs, ys)
@@ -0,0 +1,184 @@
+import numpy as np
+
+from barycentric import barycentric_basis, barycentric_weights
+
+
+def _check_nodes(xs, ys, min_nodes):
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    if len(xs) != len(ys):
+        raise ValueError("Количество x и y должно совпадать")
+    if len(xs) < min_nodes:
+        raise ValueError(f"Необходимо как минимум {min_nodes} узла")
+    if np.any(np.diff(xs) <= 0):
+        raise ValueError("Значения x должны быть отсортированы по возрастанию и не повторяться")
+    return xs, ys
+
+
+def find_segments(xs, x):
+    """
+    Поиск отрезков [xs[i], xs[i+1]], содержащих точки x, бинарным поиском.
+
+    Точки левее xs[0] относятся к первому отрезку, правее xs[-1] — к последнему.
+
+    Входные параметры:
+    xs : отсортированный массив узлов
+    x  : массив точек
+
+    Возвращает:
+    массив номеров отрезков i той же формы, что и x
+    """
+    segment = np.searchsorted(xs, x, side="right") - 1
+    return np.clip(segment, 0, len(xs) - 2)
+
+
+def local_windows(n, k):
+    """
+    Окна из k подряд идущих узлов для кусочной интерполяции по n узлам.
+
+    Окно каждого отрезка [xs[i], xs[i+1]] выбирается так, чтобы отрезок
+    был в его середине (у краёв таблицы окно прижимается к краю).
+
+    Возвращает:
+    starts : номер первого узла окна для каждого отрезка, массив (n - 1,)
+    index  : номера узлов всех возможных окон, массив (n - k + 1, k)
+    """
+    starts = np.clip(np.arange(n - 1) - (k // 2 - 1), 0, n - k)
+    index = np.arange(n - k + 1)[:, None] + np.arange(k)
+    return starts, index
+
+
+class LocalInterpolant:
+    """
+    Кусочная интерполяция многочленом степени k - 1 по k ближайшим узлам.
+
+    Для каждого отрезка заранее выбирается окно из k узлов, центрированное
+    на нём, и вычисляются коэффициенты многочлена окна. Значение в точке
+    находится за O(log n) поиска отрезка и O(k) вычисления, независимо
+    от общего размера таблицы.
+    """
+
+    def __init__(self, xs, ys, k=4, method="newton"):
+        """
+        Входные параметры:
+        xs, ys : узлы интерполяции (по возрастанию) и значения в них
+        k      : количество узлов в окне (степень многочлена k - 1)
+        method : "newton" — разделённые разности и схема Горнера,
+                 "lagrange" — многочлен Лагранжа с заранее вычисленными весами
+        """
+        self.xs, self.ys = _check_nodes(xs, ys, 2)
+        n = len(self.xs)
+        k = min(k, n)
+        if k < 2:
+            raise ValueError("Окно должно содержать как минимум 2 узла")
+        if method not in ("newton", "lagrange"):
+            raise ValueError(f"Неизвестный метод: {method}")
+        self.k = k
+        self.method = method
+
+        # Узлы и значения всех возможных окон: массивы (n - k + 1, k)
+        self.starts, index = local_windows(n, k)
+        self.window_xs = self.xs[index]
+        window_ys = self.ys[index]
+
+        if method == "newton":
+            # Разделённые разности сразу для всех окон
+            coef = window_ys.copy()
+            for j in range(1, k):
+                coef[:, j:] = (coef[:, j:] - coef[:, j - 1:-1]) / (
+                    self.window_xs[:, j:] - self.window_xs[:, :k - j])
+            self.coef = coef
+        else:
+            # Барицентрические веса сразу для всех окон
+            self.weights = barycentric_weights(self.window_xs)
+            self.window_ys = window_ys
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        start = self.starts[find_segments(self.xs, x)]
+        nodes = self.window_xs[start]
+        if self.method == "newton":
+            coef = self.coef[start]
+            total = coef[..., -1].copy()
+            for j in range(self.k - 2, -1, -1):
+                total *= x - nodes[..., j]
+                total += coef[..., j]
+        else:
+            basis = barycentric_basis(x, nodes, self.weights[start])
+            total = np.sum(basis * self.window_ys[start], axis=-1)
+        return total[()]
+
+
+def solve_tridiagonal(lower, diag, upper, rhs):
+    """
+    Решение трёхдиагональной системы lower_i x_{i-1} + diag_i x_i + upper_i x_{i+1} = rhs_i
+    методом циклической редукции.
+
+    На каждом шаге из уравнений с чётными номерами исключаются соседние
+    неизвестные, и система уменьшается вдвое; всего O(n) операций
+    за O(log n) векторных шагов вместо n шагов прогонки на Python.
+    Для матриц с диагональным преобладанием (как у сплайна) устойчив.
+
+    Входные параметры:
+    lower, diag, upper : диагонали длины n (lower[0] и upper[-1] не используются)
+    rhs                : правая часть длины n
+
+    Возвращает:
+    массив решения длины n
+    """
+    n = len(diag)
+    if n == 1:
+        return rhs / diag
+    # Уравнения дополняются тождествами x = 0 по краям, чтобы у каждого были оба соседа
+    a = np.concatenate(([0.0, 0.0], lower[1:], [0.0]))
+    b = np.concatenate(([1.0], diag, [1.0]))
+    c = np.concatenate(([0.0], upper[:-1], [0.0, 0.0]))
+    d = np.concatenate(([0.0], rhs, [0.0]))
+    keep = slice(1, n + 1, 2)
+    prev = slice(0, n, 2)
+    after = slice(2, n + 2, 2)
+    alpha = -a[keep] / b[prev]
+    gamma = -c[keep] / b[after]
+    reduced = solve_tridiagonal(
+        alpha * a[prev],
+        b[keep] + alpha * c[prev] + gamma * a[after],
+        gamma * c[after],
+        d[keep] + alpha * d[prev] + gamma * d[after],
+    )
+    x = np.zeros(n + 2)
+    x[keep] = reduced
+    odd = slice(2, n + 1, 2)
+    x[odd] = (d[odd] - a[odd] * x[1:n:2] - c[odd] * x[3:n + 2:2]) / b[odd]
+    return x[1:-1]
+
+
+class CubicSpline:
+    """
+    Кубический сплайн с естественными краевыми условиями (S'' = 0 на концах).
+
+    На каждом отрезке [x_i, x_{i+1}] хранится многочлен
+    S_i(x) = a_i + b_i d + c_i d^2 + e_i d^3, d = x - x_i.
+    Вторые производные находятся циклической редукцией за O(n) (см. solve_tridiagonal).
+    """
+
+    def __init__(self, xs, ys):
+        self.xs, self.ys = _check_nodes(xs, ys, 2)
+        n = len(self.xs)
+        h = np.diff(self.xs)
+        slope = np.diff(self.ys) / h
+
+        # Система для M_1, ..., M_{n-2}: h_{i-1} M_{i-1} + 2(h_{i-1} + h_i) M_i + h_i M_{i+1} = 6 (s_i - s_{i-1})
+        m = np.zeros(n)
+        if n > 2:
+            m[1:-1] = solve_tridiagonal(h[:-1], 2 * (h[:-1] + h[1:]), h[1:], 6 * np.diff(slope))
+
+        self.a = self.ys[:-1]
+        self.b = slope - h * (2 * m[:-1] + m[1:]) / 6
+        self.c = m[:-1] / 2
+        self.e = (m[1:] - m[:-1]) / (6 * h)
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        i = find_segments(self.xs, x)
+        d = x - self.xs[i]
+        return (self.a[i] + d * (self.b[i] + d * (self.c[i] + d * self.e[i])))[()]
@@ -0,0 +1,163 @@
+from functools import cached_property
+import os
+import numpy as np
+
+from profiling import stage
+
+
+class PlotCurve:
+    """
+    Данные графика одного метода интерполяции.
+
+    Кривая вычисляется один раз при первом обращении и затем переиспользуется
+    всеми представлениями: окном matplotlib, объектом Figure и файлом.
+    Сам matplotlib импортируется только при построении фигуры.
+    """
+
+    samples = 1000  # количество точек кривой
+
+    def __init__(self, xs, ys, x_point, interpolation_func, method_name, key=None):
+        self.xs = xs
+        self.ys = ys
+        self.x_point = x_point
+        self.interpolation_func = interpolation_func
+        self.method_name = method_name
+        self.key = key
+        self._figure = None
+
+    @cached_property
+    def x_vals(self):
+        return np.linspace(self.xs[0] - 0.1, self.xs[-1] + 0.1, self.samples)
+
+    @cached_property
+    def y_vals(self):
+        with stage(f"plot_curve:{self.key}"):
+            return self.interpolation_func(self.x_vals)
+
+    @cached_property
+    def y_point(self):
+        return self.interpolation_func(self.x_point)
+
+    def figure(self):
+        """Возвращает фигуру matplotlib, строя её при первом вызове"""
+        if self._figure is None:
+            with stage(f"plot_figure:{self.key}"):
+                self._figure = create_plot(self)
+        return self._figure
+
+    def save(self, path):
+        """Сохраняет график в файл (формат определяется расширением: png, svg, ...)"""
+        self.figure().savefig(path)
+        return path
+
+
+def _draw(ax, curve):
+    ax.plot(curve.x_vals, curve.y_vals, label=f"{curve.method_name}", color="green")
+    ax.scatter(curve.xs, curve.ys, color="blue", label="Узлы интерполяции")
+    ax.scatter([curve.x_point], [curve.y_point], color="red", label=f"P({curve.x_point:.3f})")
+    ax.set_title(f"Интерполяция методом: {curve.method_name}")
+    ax.set_xlabel("x")
+    ax.set_ylabel("y")
+    ax.grid(True)
+    ax.legend()
+
+
+def create_plot(curve):
+    """
+    Строит фигуру для графика без участия pyplot (подходит для встраивания в Tk и headless-режима).
+
+    Входные параметры:
+    curve : данные графика PlotCurve
+
+    Возвращает:
+    fig : объект matplotlib.figure.Figure
+    """
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(8, 5))
+    _draw(fig.add_subplot(), curve)
+    fig.tight_layout()
+    return fig
+
+
+class PlotView:
+    """
+    Одна фигура для последовательного показа графиков разных методов.
+
+    Линии и точки создаются один раз, при переключении метода обновляются
+    только их данные, поэтому навигация не создаёт новых фигур и холстов.
+    """
+
+    def __init__(self):
+        from matplotlib.figure import Figure
+
+        self.figure = Figure(figsize=(8, 5))
+        self.ax = self.figure.add_subplot()
+        self.line, = self.ax.plot([], [], color="green")
+        self.nodes = self.ax.scatter([], [], color="blue", label="Узлы интерполяции")
+        self.point = self.ax.scatter([], [], color="red")
+        self.ax.set_xlabel("x")
+        self.ax.set_ylabel("y")
+        self.ax.grid(True)
+        self.ax.set_title(" ")  # место под заголовок при расчёте отступов
+        self.figure.tight_layout()
+
+    def show(self, curve):
+        """Показывает график curve (кривая вычисляется при первом показе и кэшируется в curve)"""
+        self.line.set_data(curve.x_vals, curve.y_vals)
+        self.line.set_label(f"{curve.method_name}")
+        self.nodes.set_offsets(np.column_stack([curve.xs, curve.ys]))
+        self.point.set_offsets([[curve.x_point, curve.y_point]])
+        self.point.set_label(f"P({curve.x_point:.3f})")
+        self.ax.set_title(f"Интерполяция методом: {curve.method_name}")
+
+        # relim не учитывает точки scatter, поэтому пределы считаются явно
+        x_all = np.concatenate([curve.x_vals, np.ravel(curve.xs), [curve.x_point]])
+        y_all = np.concatenate([curve.y_vals, np.ravel(curve.ys), [curve.y_point]])
+        self.ax.set_xlim(*_padded_limits(x_all))
+        self.ax.set_ylim(*_padded_limits(y_all))
+        self.ax.legend()
+        self.ax.set_visible(True)
+
+    def clear(self):
+        self.ax.set_visible(False)
+
+
+def _padded_limits(values, margin=0.05):
+    values = np.asarray(values, dtype=float)
+    values = values[np.isfinite(values)]
+    if not len(values):
+        return -1.0, 1.0
+    lo, hi = values.min(), values.max()
+    pad = (hi - lo) * margin or 1.0
+    return lo - pad, hi + pad
+
+
+def draw_plot(curve):
+    """Показывает график в отдельном окне matplotlib (блокирующий вызов)"""
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(8, 5))
+    _draw(fig.add_subplot(), curve)
+    fig.tight_layout()
+    plt.show()
+
+
+def save_plots(curves, directory, fmt="png"):
+    """
+    Сохраняет графики в каталог без отображения окон.
+
+    Входные параметры:
+    curves    : список PlotCurve
+    directory : каталог для файлов (создаётся при необходимости)
+    fmt       : формат файлов, например "png" или "svg"
+
+    Возвращает:
+    список путей к сохранённым файлам
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for i, curve in enumerate(curves, 1):
+        name = curve.key or "plot"
+        paths.append(curve.save(os.path.join(directory, f"{i:02d}_{name}.{fmt}")))
+    return paths
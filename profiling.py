@@ -0,0 +1,171 @@
+"""
+Встроенное профилирование этапов вычисления.
+
+Выключено по умолчанию: stage() ничего не делает, пока нет активного профилировщика.
+Включается контекстным менеджером:
+
+    with profile() as prof:
+        solve(xs, ys, x, n, show_plots=False)
+    print(prof.summary())
+
+или переменной окружения INTERP_PROFILE: значение "1" печатает сводку в stderr
+при завершении процесса, любое другое значение — путь к JSON-файлу трассы.
+INTERP_PROFILE_MEMORY=1 дополнительно включает учёт выделений памяти через tracemalloc.
+
+В процессах-воркерах (ProcessPoolExecutor) обработчики atexit не вызываются,
+поэтому воркер должен профилировать задачу сам и вернуть summary() вместе
+с результатом, а родительский процесс — добавить её через Profiler.merge
+(так делает cli.py при --jobs N). События трассы воркеров не переносятся.
+"""
+from contextlib import contextmanager
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+_active = None
+
+
+class Profiler:
+    """
+    Сборщик таймеров, счётчиков вызовов и пиков памяти по именованным этапам.
+
+    При track_memory=True для каждого этапа фиксируется пик выделенной памяти
+    (tracemalloc) сверх уровня на момент входа в этап; для вложенных этапов
+    пик внешнего этапа учитывается с момента выхода из последнего вложенного.
+    """
+
+    def __init__(self, track_memory=False):
+        self.track_memory = track_memory
+        self.stats = {}
+        self.events = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._started_tracemalloc = False
+
+    def start(self):
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self):
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def stage(self, name):
+        memory = self.track_memory and tracemalloc.is_tracing()
+        if memory:
+            base, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] - base if memory else None
+            self._record(name, start, duration, peak)
+
+    def _record(self, name, start, duration, peak):
+        with self._lock:
+            entry = self.stats.setdefault(
+                name, {"calls": 0, "total_seconds": 0.0, "max_seconds": 0.0, "peak_bytes": 0}
+            )
+            entry["calls"] += 1
+            entry["total_seconds"] += duration
+            entry["max_seconds"] = max(entry["max_seconds"], duration)
+            if peak is not None:
+                entry["peak_bytes"] = max(entry["peak_bytes"], peak)
+            self.events.append({
+                "name": name,
+                "start": start - self._origin,
+                "duration": duration,
+                "thread": threading.current_thread().name,
+                "peak_bytes": peak,
+            })
+
+    def merge(self, summary):
+        """Добавляет сводку summary() другого профилировщика (например, из процесса-воркера)"""
+        with self._lock:
+            for name, other in summary.items():
+                entry = self.stats.setdefault(
+                    name, {"calls": 0, "total_seconds": 0.0, "max_seconds": 0.0, "peak_bytes": 0}
+                )
+                entry["calls"] += other["calls"]
+                entry["total_seconds"] += other["total_seconds"]
+                entry["max_seconds"] = max(entry["max_seconds"], other["max_seconds"])
+                entry["peak_bytes"] = max(entry["peak_bytes"], other["peak_bytes"])
+
+    def summary(self):
+        """Сводка по этапам: {имя: {calls, total_seconds, max_seconds, mean_seconds, peak_bytes}}"""
+        with self._lock:
+            return {
+                name: dict(entry, mean_seconds=entry["total_seconds"] / entry["calls"])
+                for name, entry in self.stats.items()
+            }
+
+    def trace(self):
+        """Полная трасса: сводка и список событий в порядке завершения"""
+        with self._lock:
+            events = list(self.events)
+        return {"summary": self.summary(), "events": events}
+
+    def to_json(self, filename):
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(self.trace(), f, ensure_ascii=False, indent=2)
+
+
+def active_profiler():
+    """Активный профилировщик или None, если профилирование выключено"""
+    return _active
+
+
+@contextmanager
+def stage(name):
+    """Замер этапа name активным профилировщиком (без профилировщика — пустая операция)"""
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    with profiler.stage(name):
+        yield
+
+
+@contextmanager
+def profile(track_memory=True):
+    """Включает профилирование на время блока with и возвращает Profiler"""
+    global _active
+    previous = _active
+    profiler = Profiler(track_memory)
+    profiler.start()
+    _active = profiler
+    try:
+        yield profiler
+    finally:
+        _active = previous
+        profiler.stop()
+
+
+def _profile_from_environment():
+    global _active
+    target = os.environ.get("INTERP_PROFILE")
+    if not target:
+        return
+    _active = Profiler(track_memory=os.environ.get("INTERP_PROFILE_MEMORY") == "1")
+    _active.start()
+
+    def report(profiler=_active):
+        if target == "1":
+            json.dump(profiler.summary(), sys.stderr, ensure_ascii=False, indent=2)
+            sys.stderr.write("\n")
+        else:
+            profiler.to_json(target)
+
+    atexit.register(report)
+
+
+_profile_from_environment()
@@ -1,98 +1,485 @@
-from math import factorial
+import csv
 import numpy as np
-import matplotlib.pyplot as plt
 
+from barycentric import barycentric_basis, barycentric_sum, barycentric_weights
+from chebyshev import ChebyshevNodesInterpolant, chebyshev_interval
+from difftable import FiniteDifferenceTable, diagonal_differences
+from nodes import NodeSet, as_node_set
+from plots import PlotCurve, draw_plot, save_plots
+from profiling import stage
+from stable import COMPENSATED_METHODS
 
-def lagrange_polynomial(xs, ys, n, x):
+
+def divided_differences(xs, ys):
     """
-    Интерполяция по методу Лагранжа.
+    Вычисление коэффициентов для интерполяционного многочлена Ньютона по разделённым разностям.
 
     Входные параметры:
     xs : массив координат узлов интерполяции
-    ys : массив значений функции в узлах
-    n  : количество узлов
-    x  : точка, в которой вычисляем значение интерполированного многочлена
+    ys : массив значений функции в узлах (n,) или матрица (n, m) — m функций на общих узлах
 
     Возвращает:
-    значение интерполированного многочлена в точке x
+    coef : массив коэффициентов разделённых разностей формы ys
     """
-    total = 0
-    for i in range(n):
-        product = 1
-        for j in range(n):
-            if i != j:
-                product *= (x - xs[j]) / (xs[i] - xs[j])
-        total += ys[i] * product
-    return total
+    xs = np.asarray(xs, dtype=float)
+    coef = np.array(ys, dtype=float)
+    n = len(coef)
+    for j in range(1, n):
+        # Разности порядка j для всех i >= j (и всех столбцов) одной векторной операцией
+        step = (xs[j:] - xs[:-j]).reshape((n - j,) + (1,) * (coef.ndim - 1))
+        coef[j:] = (coef[j:] - coef[j - 1:-1]) / step
+    return coef
 
 
-def divided_differences(xs, ys):
+def finite_differences(ys):
     """
-    Вычисление коэффициентов для интерполяционного многочлена Ньютона по разделённым разностям.
+    Построение таблицы конечных разностей для метода конечных разностей.
 
     Входные параметры:
-    xs : массив координат узлов интерполяции
-    ys : массив значений функции в узлах
+    ys : массив значений функции в узлах интерполяции (n,) или матрица (n, m)
 
     Возвращает:
-    coef : список коэффициентов разделённых разностей
+    delta_y : треугольная таблица конечных разностей FiniteDifferenceTable,
+              delta_y[i][k] = Δ^k y_i
     """
-    n = len(ys)
-    coef = ys.copy()
-    for j in range(1, n):
-        for i in range(n - 1, j - 1, -1):
-            coef[i] = (coef[i] - coef[i - 1]) / (xs[i] - xs[i - j])
-    return coef
+    return FiniteDifferenceTable(ys)
 
 
-def newton_divided_difference_polynomial(xs, ys, n, x):
+def horner(coef, shifts, t):
     """
-    Интерполяция многочленом Ньютона с использованием разделённых разностей.
+    Вычисление многочлена в форме Ньютона по схеме Горнера.
+
+    P(t) = coef[0] + coef[1](t - shifts[0]) + coef[2](t - shifts[0])(t - shifts[1]) + ...
+
+    Входные параметры:
+    coef   : коэффициенты многочлена (n,) или (n, m) для m многочленов с общими сдвигами
+    shifts : сдвиги множителей (не менее len(coef) - 1 значений)
+    t      : точка или массив точек
+
+    Возвращает:
+    значение многочлена в точке t (массив формы t.shape или t.shape + (m,))
+    """
+    coef = np.asarray(coef, dtype=float)
+    t = np.asarray(t, dtype=float)
+    t = t.reshape(t.shape + (1,) * (coef.ndim - 1))
+    total = coef[-1] * np.ones_like(t)
+    for k in range(len(coef) - 2, -1, -1):
+        total *= t - shifts[k]
+        total += coef[k]
+    return total[()]
+
+
+def horner_derivative(coef, shifts, t):
+    """
+    Значение многочлена в форме Ньютона и его первой производной по схеме Горнера.
+
+    Входные параметры:
+    coef   : коэффициенты многочлена (n,) или (n, m)
+    shifts : сдвиги множителей
+    t      : точка или массив точек
+
+    Возвращает:
+    value, derivative : массивы той же формы, что и результат horner
+    """
+    coef = np.asarray(coef, dtype=float)
+    t = np.asarray(t, dtype=float)
+    t = t.reshape(t.shape + (1,) * (coef.ndim - 1))
+    value = coef[-1] * np.ones_like(t)
+    derivative = np.zeros_like(value)
+    for k in range(len(coef) - 2, -1, -1):
+        derivative *= t - shifts[k]
+        derivative += value
+        value *= t - shifts[k]
+        value += coef[k]
+    return value[()], derivative[()]
+
+
+def _taylor_coefficients(coef, shifts, t, order):
+    """
+    Коэффициенты Тейлора p^(j)(t) / j!, j = 0..order, многочлена в форме Ньютона.
+
+    Обобщённая схема Горнера: на каждом шаге коэффициенты порядка j
+    обновляются по коэффициентам порядка j - 1, все точки t — одновременно.
+
+    Возвращает:
+    массив формы (order + 1,) + форма результата horner
+    """
+    coef = np.asarray(coef, dtype=float)
+    t = np.asarray(t, dtype=float)
+    t = t.reshape(t.shape + (1,) * (coef.ndim - 1))
+    n = len(coef)
+    d = np.zeros((order + 1,) + np.broadcast(t, coef[-1]).shape)
+    d[0] = coef[-1]
+    for k in range(n - 2, -1, -1):
+        factor = t - shifts[k]
+        for j in range(min(order, n - 1 - k), 0, -1):
+            d[j] *= factor
+            d[j] += d[j - 1]
+        d[0] *= factor
+        d[0] += coef[k]
+    return d
+
+
+def horner_derivatives(coef, shifts, t, order):
+    """
+    Производные многочлена в форме Ньютона до порядка order включительно.
+
+    Входные параметры:
+    coef   : коэффициенты многочлена (n,) или (n, m)
+    shifts : сдвиги множителей
+    t      : точка или массив точек
+    order  : наибольший порядок производной (производные порядка >= n равны нулю)
+
+    Возвращает:
+    массив формы (order + 1,) + форма результата horner, элемент j — p^(j)(t)
+    """
+    d = _taylor_coefficients(coef, shifts, t, order)
+    scale = np.cumprod(np.concatenate(([1.0], np.arange(1, order + 1))))  # j!
+    return d * scale.reshape((order + 1,) + (1,) * (d.ndim - 1))
+
+
+def horner_integral(coef, shifts, a, b):
+    """
+    Точный определённый интеграл многочлена в форме Ньютона по отрезку [a, b].
+
+    Многочлен один раз раскладывается по степеням (t - c), c — середина
+    отрезка сдвигов, затем первообразная вычисляется по схеме Горнера
+    во всех концах отрезков одновременно.
+
+    Входные параметры:
+    coef   : коэффициенты многочлена (n,) или (n, m)
+    shifts : сдвиги множителей
+    a, b   : границы интегрирования (числа или массивы одной формы)
+
+    Возвращает:
+    значение интеграла (массив формы a.shape или a.shape + (m,))
+    """
+    coef = np.asarray(coef, dtype=float)
+    n = len(coef)
+    used = np.asarray(shifts[:max(n - 1, 1)], dtype=float)
+    center = (used.min() + used.max()) / 2
+    taylor = _taylor_coefficients(coef, shifts, center, n - 1)
+    # Первообразная: sum_j taylor[j] (t - c)^(j + 1) / (j + 1)
+    antiderivative = taylor / np.arange(1, n + 1).reshape((n,) + (1,) * (taylor.ndim - 1))
+
+    def primitive(t):
+        u = np.asarray(t, dtype=float) - center
+        u = u.reshape(u.shape + (1,) * (coef.ndim - 1))
+        total = antiderivative[-1] * np.ones_like(u)
+        for j in range(n - 2, -1, -1):
+            total *= u
+            total += antiderivative[j]
+        return total * u
+
+    return (primitive(b) - primitive(a))[()]
+
+
+class LagrangeInterpolant:
+    """
+    Многочлен Лагранжа во второй барицентрической форме.
+
+    P(x) = sum(w_i * y_i / (x - xs[i])) / sum(w_i / (x - xs[i])).
+    Веса w_i вычисляются один раз с общим множителем 2^p, который сокращается
+    в формуле, поэтому вычисление не переполняется при сотнях и тысячах узлов;
+    значение в точке находится за O(n), для матрицы ys формы (n, m) —
+    сразу для всех m функций.
+    """
+
+    def __init__(self, xs, ys=None):
+        nodes = as_node_set(xs, ys)
+        self.xs, self.ys = nodes.xs, nodes.ys
+        self.weights = barycentric_weights(self.xs)
+
+    def basis(self, x):
+        """
+        Значения базисных многочленов Лагранжа l_i(x).
+
+        Возвращает:
+        массив формы x.shape + (n,)
+        """
+        return barycentric_basis(x, self.xs, self.weights)
+
+    def __call__(self, x):
+        return barycentric_sum(x, self.xs, self.ys, self.weights)
+
+    def _newton(self):
+        # Тот же многочлен в форме Ньютона — для производных и интегралов
+        if not hasattr(self, "_newton_form"):
+            self._newton_form = NewtonInterpolant(self.xs, self.ys)
+        return self._newton_form
+
+    def derivative(self, x, order=1):
+        """Производная порядка order в точке (или массиве точек) x"""
+        return self._newton().derivative(x, order)
+
+    def integrate(self, a, b):
+        """Точный интеграл многочлена по отрезку [a, b] (a, b — числа или массивы)"""
+        return self._newton().integrate(a, b)
+
+
+class NewtonInterpolant:
+    """
+    Многочлен Ньютона по разделённым разностям.
+
+    Таблица разделённых разностей строится один раз в конструкторе,
+    вычисление в точке выполняется по схеме Горнера за O(n).
+    """
+
+    def __init__(self, xs, ys=None):
+        nodes = as_node_set(xs, ys)
+        self.xs, self.ys = nodes.xs, nodes.ys
+        self.coef = divided_differences(self.xs, self.ys)
+
+    def __call__(self, x):
+        return horner(self.coef, self.xs, x)
+
+    def value_and_derivative(self, x):
+        """Значение многочлена и его первой производной в точке x"""
+        return horner_derivative(self.coef, self.xs, x)
+
+    def derivative(self, x, order=1):
+        """Производная порядка order в точке (или массиве точек) x"""
+        return horner_derivatives(self.coef, self.xs, x, order)[order][()]
+
+    def integrate(self, a, b):
+        """Точный интеграл многочлена по отрезку [a, b] (a, b — числа или массивы)"""
+        return horner_integral(self.coef, self.xs, a, b)
+
+
+class NewtonFiniteInterpolant:
+    """
+    Многочлен Ньютона по конечным разностям (равноотстоящие узлы).
+
+    Хранит коэффициенты Δ^k y_0 / k!, вычисление в точке выполняется
+    по схеме Горнера относительно t = (x - x_0) / h за O(n).
+    """
+
+    def __init__(self, xs, ys=None):
+        nodes = as_node_set(xs, ys)
+        if not nodes.uniform:
+            raise ValueError("Метод конечных разностей требует равноотстоящих узлов")
+        self.xs, self.ys = nodes.xs, nodes.ys
+        self.h = nodes.h  # шаг
+        n = nodes.n
+        # Нужна только первая строка таблицы: Δ^k y_0 без хранения всей таблицы
+        delta_y0 = diagonal_differences(self.ys, np.zeros(n, dtype=int))
+        # 1 / k! накапливается делением на k, без вычисления factorial(k)
+        inv_factorial = np.cumprod(np.concatenate(([1.0], 1.0 / np.arange(1, n))))
+        self.coef = delta_y0 * inv_factorial.reshape((n,) + (1,) * (self.ys.ndim - 1))
+
+    def __call__(self, x):
+        t = (np.asarray(x, dtype=float) - self.xs[0]) / self.h
+        return horner(self.coef, np.arange(len(self.coef)), t)
+
+    def value_and_derivative(self, x):
+        """Значение многочлена и его первой производной по x в точке x"""
+        t = (np.asarray(x, dtype=float) - self.xs[0]) / self.h
+        value, derivative = horner_derivative(self.coef, np.arange(len(self.coef)), t)
+        return value, derivative / self.h
+
+    def derivative(self, x, order=1):
+        """Производная порядка order по x в точке (или массиве точек) x"""
+        t = (np.asarray(x, dtype=float) - self.xs[0]) / self.h
+        d = horner_derivatives(self.coef, np.arange(len(self.coef)), t, order)[order]
+        return (d / self.h ** order)[()]
+
+    def integrate(self, a, b):
+        """Точный интеграл многочлена по отрезку [a, b] (a, b — числа или массивы)"""
+        ta = (np.asarray(a, dtype=float) - self.xs[0]) / self.h
+        tb = (np.asarray(b, dtype=float) - self.xs[0]) / self.h
+        return (horner_integral(self.coef, np.arange(len(self.coef)), ta, tb) * self.h)[()]
+
+
+def gauss_shifts(count, forward=True):
+    """
+    Сдвиги множителей формулы Гаусса: произведение для члена k равно prod_{j < k}(t - s_j).
+
+    Первая (прямая) формула: s = 0, 1, -1, 2, -2, ...
+    Вторая (обратная) формула: s = 0, -1, 1, -2, 2, ...
+    """
+    j = np.arange(count)
+    shifts = np.where(j % 2 == 1, (j + 1) // 2, -(j // 2))
+    return shifts if forward else -shifts
+
+
+class GaussInterpolant:
+    """
+    Многочлены Гаусса, Стирлинга и Бесселя по центральным конечным разностям (равноотстоящие узлы).
+
+    Для узла c и t = (x - x_c) / h член порядка k содержит разность
+    Δ^k y_{c - floor(k/2)} (первая формула Гаусса) или Δ^k y_{c - ceil(k/2)}
+    (вторая формула). Формула Стирлинга — полусумма двух формул Гаусса с центром c,
+    формула Бесселя — полусумма первой формулы с центром c и второй с центром c + 1.
+    В каждой формуле используются все члены, для которых в таблице есть разности,
+    поэтому число узлов не ограничено.
+
+    formula="auto" выбирает формулу по положению x относительно центрального узла:
+    |t| <= 0.25 — Стирлинг, 0.25 < |t| < 0.75 — Бессель на ближайшем полуинтервале,
+    t >= 0.75 — первая формула Гаусса, t <= -0.75 — вторая.
+    """
+
+    FORMULAS = ("auto", "gauss1", "gauss2", "stirling", "bessel")
+
+    def __init__(self, xs, ys=None, n=None, formula="auto"):
+        if formula not in self.FORMULAS:
+            raise ValueError(f"Неизвестная формула: {formula}")
+        nodes = as_node_set(xs, ys)
+        if nodes.n > 1 and not nodes.uniform:
+            raise ValueError("Метод конечных разностей требует равноотстоящих узлов")
+        self.xs, self.ys = nodes.xs, nodes.ys
+        m = nodes.n
+        self.m = m
+        self.n = m if n is None else n  # максимальное число членов
+        self.formula = formula
+        self.alpha_ind = (m - 1) // 2  # центральный узел
+        self.h = nodes.h if m > 1 else 1.0
+        self._series = {}
+
+    def _diagonal(self, center, forward):
+        """Номера узлов разностей Δ^k y_i ряда с центром center, пока они есть в таблице"""
+        starts = []
+        for k in range(min(self.n, self.m)):
+            i = center - (k // 2 if forward else (k + 1) // 2)
+            if i < 0 or i + k > self.m - 1:
+                break
+            starts.append(i)
+        return starts
+
+    def _prepare(self, keys):
+        """
+        Вычисляет ряды для пар (center, forward) из keys за один проход по столбцам
+        таблицы разностей (сама таблица не хранится: O(n) памяти).
+        """
+        keys = [key for key in dict.fromkeys(keys) if key not in self._series]
+        if not keys:
+            return
+        diagonals = [self._diagonal(*key) for key in keys]
+        count = max(len(starts) for starts in diagonals)
+        index = np.zeros((count, len(keys)), dtype=int)
+        for s, starts in enumerate(diagonals):
+            index[:len(starts), s] = starts
+        differences = diagonal_differences(self.ys, index)
+        # 1 / k! накапливается делением на k, без вычисления factorial(k)
+        inv_factorial = np.cumprod(np.concatenate(([1.0], 1.0 / np.arange(1, max(count, 1)))))[:count]
+        inv_factorial = inv_factorial.reshape((count,) + (1,) * (self.ys.ndim - 1))
+        for s, (key, starts) in enumerate(zip(keys, diagonals)):
+            coef = differences[:len(starts), s] * inv_factorial[:len(starts)]
+            self._series[key] = (coef, gauss_shifts(len(starts), key[1]))
+
+    def series(self, center, forward=True):
+        """
+        Коэффициенты Δ^k y_i / k! и сдвиги формулы Гаусса с центром в узле center.
+
+        Ряд обрывается на первом порядке, для которого в таблице нет нужной разности.
+        """
+        self._prepare([(center, forward)])
+        return self._series[(center, forward)]
+
+    def _pair(self, t, center_1, center_2, shift_2):
+        """Полусумма первой формулы с центром center_1 и второй с центром center_2 (одинаковое число членов)"""
+        coef_1, shifts_1 = self.series(center_1, True)
+        coef_2, shifts_2 = self.series(center_2, False)
+        count = min(len(coef_1), len(coef_2))
+        if count == 0:
+            return horner(*self.series(center_1, True), t)
+        return (horner(coef_1[:count], shifts_1, t) + horner(coef_2[:count], shifts_2, t - shift_2)) / 2
+
+    def evaluate(self, formula, t, center=None):
+        """
+        Значение выбранной формулы в точках t = (x - x_center) / h.
+
+        Для формулы Бесселя центр — левый узел полуинтервала [x_c, x_{c+1}].
+        """
+        c = self.alpha_ind if center is None else center
+        if formula == "gauss1":
+            return horner(*self.series(c, True), t)
+        if formula == "gauss2":
+            return horner(*self.series(c, False), t)
+        if formula == "stirling":
+            return self._pair(t, c, c, 0)
+        if formula == "bessel":
+            if c + 1 > self.m - 1:
+                return horner(*self.series(c, False), t)
+            return self._pair(t, c, c + 1, 1)
+        raise ValueError(f"Неизвестная формула: {formula}")
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        c = self.alpha_ind
+        t = (x - self.xs[c]) / self.h
+        if self.formula != "auto":
+            return np.asarray(self.evaluate(self.formula, t))[()]
+
+        shape = t.shape + self.ys.shape[1:]
+        t = t.ravel()
+        total = np.empty(t.shape + self.ys.shape[1:])
+        # Все ряды, которые могут понадобиться, — за один проход по таблице
+        self._prepare([(c - 1, True), (c, True), (c, False), (c + 1, False)])
+        # Для каждой области — формулы в порядке предпочтения (формула, центр, смещение t)
+        parts = [
+            (np.abs(t) <= 0.25, [("stirling", c, 0), ("gauss1", c, 0), ("gauss2", c, 0), ("bessel", c, 0)]),
+            ((t > 0.25) & (t < 0.75), [("bessel", c, 0), ("gauss1", c, 0), ("stirling", c, 0), ("gauss2", c, 0)]),
+            ((t < -0.25) & (t > -0.75), [("bessel", c - 1, -1), ("gauss2", c, 0), ("stirling", c, 0),
+                                         ("gauss1", c, 0)]),
+            (t >= 0.75, [("gauss1", c, 0), ("bessel", c, 0), ("stirling", c, 0), ("gauss2", c, 0)]),
+            (t <= -0.75, [("gauss2", c, 0), ("bessel", c - 1, -1), ("stirling", c, 0), ("gauss1", c, 0)]),
+        ]
+        for mask, candidates in parts:
+            if not np.any(mask):
+                continue
+            # Из формул с наибольшим числом членов берётся первая по предпочтению
+            best = max(self.terms(formula, center) for formula, center, _ in candidates)
+            formula, center, offset = next(
+                option for option in candidates if self.terms(option[0], option[1]) == best
+            )
+            total[mask] = self.evaluate(formula, t[mask] - offset, center)
+        return total.reshape(shape)[()]
+
+    def terms(self, formula, center):
+        """Число членов формулы с центром center, для которых в таблице есть разности"""
+        if center < 0 or center > self.m - 1:
+            return 0
+        if formula == "gauss1":
+            return len(self.series(center, True)[0])
+        if formula == "gauss2":
+            return len(self.series(center, False)[0])
+        if formula == "stirling":
+            return min(self.terms("gauss1", center), self.terms("gauss2", center))
+        if formula == "bessel":
+            return min(self.terms("gauss1", center), self.terms("gauss2", center + 1))
+        raise ValueError(f"Неизвестная формула: {formula}")
+
+
+def lagrange_polynomial(xs, ys, n, x):
+    """
+    Интерполяция по методу Лагранжа.
 
     Входные параметры:
     xs : массив координат узлов интерполяции
     ys : массив значений функции в узлах
     n  : количество узлов
-    x  : точка, в которой вычисляем значение интерполированного многочлена
+    x  : точка (или массив точек), в которой вычисляем значение интерполированного многочлена
 
     Возвращает:
-    значение интерполированного многочлена в точке x
+    значение интерполированного многочлена в точке x (массив той же формы, что и x)
     """
-    coef = divided_differences(xs, ys)
-    total = ys[0]
-    for k in range(1, n):
-        product = 1
-        for j in range(k):
-            product *= x - xs[j]
-        total += coef[k] * product
-    return total
+    return LagrangeInterpolant(xs[:n], ys[:n])(x)
 
 
-def finite_differences(ys):
+def newton_divided_difference_polynomial(xs, ys, n, x):
     """
-    Построение таблицы конечных разностей для метода конечных разностей.
+    Интерполяция многочленом Ньютона с использованием разделённых разностей.
 
     Входные параметры:
-    ys : массив значений функции в узлах интерполяции
+    xs : массив координат узлов интерполяции
+    ys : массив значений функции в узлах
+    n  : количество узлов
+    x  : точка (или массив точек), в которой вычисляем значение интерполированного многочлена
 
     Возвращает:
-    delta_y : двумерный список (матрица) конечных разностей размером n x n
+    значение интерполированного многочлена в точке x (массив той же формы, что и x)
     """
-    n = len(ys)
-    # Инициализация пустой матрицы нулями
-    delta_y = []
-    for _ in range(n):
-        row = []
-        for _ in range(n):
-            row.append(0)
-        delta_y.append(row)
-
-    for i in range(n):
-        delta_y[i][0] = ys[i]
-    for j in range(1, n):
-        for i in range(n - j):
-            delta_y[i][j] = delta_y[i + 1][j - 1] - delta_y[i][j - 1]
-    return delta_y
+    return NewtonInterpolant(xs[:n], ys[:n])(x)
 
 
 def newton_finite_difference_polynomial(xs, ys, n, x):
@@ -103,21 +490,12 @@ def newton_finite_difference_polynomial(xs, ys, n, x):
     xs : массив координат узлов интерполяции (равномерно расположенных)
     ys : массив значений функции в узлах
     n  : количество узлов
-    x  : точка, в которой вычисляем значение интерполированного многочлена
+    x  : точка (или массив точек), в которой вычисляем значение интерполированного многочлена
 
     Возвращает:
-    значение интерполированного многочлена в точке x
+    значение интерполированного многочлена в точке x (массив той же формы, что и x)
     """
-
-    h = xs[1] - xs[0]  # шаг
-    delta_y = finite_differences(ys)
-    total = ys[0]
-    for k in range(1, n):
-        product = 1
-        for j in range(k):
-            product *= (x - xs[0]) / h - j
-        total += delta_y[0][k] * product / factorial(k)
-    return total
+    return NewtonFiniteInterpolant(xs[:n], ys[:n])(x)
 
 
 def gauss_polynomial(xs, ys, n, x):
@@ -127,124 +505,320 @@ def gauss_polynomial(xs, ys, n, x):
     Входные параметры:
     xs : массив координат узлов интерполяции (равномерно расположенных)
     ys : массив значений функции в узлах
-    n  : количество узлов
-    x  : точка, в которой вычисляем значение интерполированного многочлена
+    n  : количество узлов (наибольшее число членов формулы)
+    x  : точка (или массив точек), в которой вычисляем значение интерполированного многочлена
 
     Возвращает:
-    значение интерполированного многочлена в точке x
+    значение интерполированного многочлена в точке x (массив той же формы, что и x)
     """
+    return GaussInterpolant(xs, ys, n)(x)
 
-    m = len(xs)
-    alpha_ind = (m - 1) // 2  # центральный узел
 
-    # Построение таблицы конечных разностей
-    fin_difs = []
-    fin_difs.append(ys[:])
-    for k in range(1, m):
-        prev = fin_difs[-1]
-        current = []
-        for i in range(len(prev) - 1):
-            current.append(prev[i + 1] - prev[i])
-        fin_difs.append(current)
+def newton_derivative(xs, ys, n, x, order=1):
+    """
+    Производная интерполяционного многочлена Ньютона по разделённым разностям.
+
+    Входные параметры:
+    xs    : массив координат узлов интерполяции
+    ys    : массив значений функции в узлах
+    n     : количество узлов
+    x     : точка (или массив точек), в которой вычисляем производную
+    order : порядок производной
 
-    h = xs[1] - xs[0]
-    t = (x - xs[alpha_ind]) / h
-    total = ys[alpha_ind]
+    Возвращает:
+    значение производной порядка order в точке x (массив той же формы, что и x)
+    """
+    return NewtonInterpolant(xs[:n], ys[:n]).derivative(x, order)
 
-    dts = [0, 1, -1, 2, -2, 3, -3, 4, -4]  # порядок множителей для произведения
-    for k in range(1, n):
-        product = 1
-        for j in range(k):
-            product *= t + dts[j]
-        mid_index = len(fin_difs[k]) // 2
-        if len(fin_difs[k]) % 2 == 0:
-            index = mid_index - 1
-        else:
-            index = mid_index
-        total += fin_difs[k][index] * product / factorial(k)
 
-    return total
+def newton_integral(xs, ys, n, a, b):
+    """
+    Точный определённый интеграл интерполяционного многочлена Ньютона.
+
+    Входные параметры:
+    xs   : массив координат узлов интерполяции
+    ys   : массив значений функции в узлах
+    n    : количество узлов
+    a, b : границы интегрирования (числа или массивы одной формы)
+
+    Возвращает:
+    интеграл многочлена по отрезку [a, b] (массив той же формы, что и a)
+    """
+    return NewtonInterpolant(xs[:n], ys[:n]).integrate(a, b)
+
+
+def newton_adaptive(xs, ys, x, tol=1e-10, max_terms=None, patience=3):
+    """
+    Интерполяция многочленом Ньютона с адаптивным выбором степени.
 
+    Для каждой точки x узлы добавляются по одному в порядке удалённости от x
+    (окно вокруг ближайшего узла расширяется в сторону более близкого соседа),
+    разделённые разности пересчитываются по последней диагонали. Добавление
+    членов прекращается, когда очередная поправка меньше tol или когда
+    относительная поправка |поправка| / |значение| растёт patience членов подряд
+    (разности достигли уровня шума). Во втором случае результатом считается
+    значение до начала роста, с наименьшей относительной поправкой.
 
-def print_finite_differences_table(delta_y):
+    Входные параметры:
+    xs        : массив координат узлов (по возрастанию)
+    ys        : массив значений функции в узлах
+    x         : точка (или массив точек)
+    tol       : порог модуля поправки для остановки
+    max_terms : наибольшее число членов (по умолчанию — все узлы)
+    patience  : сколько членов подряд относительная поправка должна расти,
+                чтобы признать её шумом (одиночный рост, например после
+                малой поправки первого порядка, остановки не вызывает)
+
+    Возвращает:
+    value  : значение многочлена в точке x
+    degree : использованная степень многочлена
+    error  : оценка погрешности — модуль последней учтённой поправки
+             (при остановке по шуму — наименьшей из поправок)
+    """
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    x = np.asarray(x, dtype=float)
+    shape = x.shape
+    x = x.ravel()
+    n = len(xs)
+    terms = n if max_terms is None else min(max_terms, n)
+
+    # Ближайший к каждой точке узел
+    pos = np.clip(np.searchsorted(xs, x), 1, n - 1) if n > 1 else np.zeros(len(x), dtype=int)
+    if n > 1:
+        pos = np.where(x - xs[pos - 1] <= xs[pos] - x, pos - 1, pos)
+    left = pos.copy()
+    right = pos.copy()
+
+    nodes = [xs[pos]]
+    diagonal = [ys[pos]]
+    value = ys[pos].copy()
+    degree = np.zeros(len(x), dtype=int)
+    error = np.zeros(len(x))
+    product = np.ones_like(x)
+    last_relative = np.full(len(x), np.inf)
+    growth = np.zeros(len(x), dtype=int)  # сколько членов подряд относительная поправка растёт
+    # Значение с наименьшей относительной поправкой — результат при остановке по шуму
+    best_value = value.copy()
+    best_degree = degree.copy()
+    best_error = np.full(len(x), np.inf)
+    active = np.ones(len(x), dtype=bool)
+    tiny = np.finfo(float).tiny
+
+    for k in range(1, terms):
+        if not np.any(active):
+            break
+        # Следующий узел — более близкий из соседей окна
+        dist_left = np.where(left > 0, x - xs[np.maximum(left - 1, 0)], np.inf)
+        dist_right = np.where(right < n - 1, xs[np.minimum(right + 1, n - 1)] - x, np.inf)
+        take_left = dist_left <= dist_right
+        index = np.where(take_left, left - 1, right + 1)
+        left = np.where(take_left, index, left)
+        right = np.where(take_left, right, index)
+
+        z = xs[index]
+        new_diagonal = [ys[index]]
+        for j in range(1, k + 1):
+            new_diagonal.append((new_diagonal[j - 1] - diagonal[j - 1]) / (z - nodes[k - j]))
+        diagonal = new_diagonal
+
+        product *= x - nodes[k - 1]
+        nodes.append(z)
+        term = diagonal[k] * product
+
+        relative = np.abs(term) / np.maximum(np.abs(value), tiny)
+        growing = relative > last_relative
+        growth = np.where(active & growing, growth + 1, np.where(active, 0, growth))
+        value[active] += term[active]
+        degree[active] = k
+        error[active] = np.abs(term[active])
+        last_relative = np.where(active, relative, last_relative)
+
+        improved = active & ~growing
+        best_value[improved] = value[improved]
+        best_degree[improved] = degree[improved]
+        best_error[improved] = error[improved]
+
+        noise = active & (growth >= patience)  # поправки растут — уровень шума
+        value[noise] = best_value[noise]
+        degree[noise] = best_degree[noise]
+        error[noise] = best_error[noise]
+        active &= ~noise & ~(np.abs(term) < tol)
+
+    return value.reshape(shape)[()], degree.reshape(shape)[()], error.reshape(shape)[()]
+
+
+def iter_finite_differences_rows(delta_y, start=0, stop=None, max_order=None):
+    """
+    Построчный генератор текстового представления таблицы конечных разностей.
+
+    Входные параметры:
+    delta_y   : таблица FiniteDifferenceTable
+    start     : номер первой строки
+    stop      : номер строки, на которой остановиться (по умолчанию — до конца)
+    max_order : наибольший выводимый порядок разностей (по умолчанию — все)
+
+    Возвращает (генератор):
+    строки со значениями, разделёнными табуляцией
+    """
     n = len(delta_y)
-    table = "Таблица конечных разностей:\n"
-    for i in range(n):
-        row = []
-        for j in range(n - i):
-            row.append(f"{delta_y[i][j]:.4f}")
-        table += "\t".join(row) + "\n"
-    return table
-
-
-def draw_plot(xs, ys, x_point, interpolation_func, method_name):
-    x_vals = np.linspace(xs[0] - 0.1, xs[-1] + 0.1, 1000)
-    y_vals = [interpolation_func(x) for x in x_vals]
-
-    plt.figure(figsize=(8, 5))
-    plt.plot(x_vals, y_vals, label=f"{method_name}", color="green")
-    plt.scatter(xs, ys, color="blue", label="Узлы интерполяции")
-    plt.scatter([x_point], [interpolation_func(x_point)], color="red", label=f"P({x_point:.3f})")
-    plt.title(f"Интерполяция методом: {method_name}")
-    plt.xlabel("x")
-    plt.ylabel("y")
-    plt.grid(True)
-    plt.legend()
-    plt.tight_layout()
-    plt.show()
-
-
-def solve(xs, ys, x, n, return_plots=False):
-    results = ""
-    delta_y = finite_differences(ys)
-    results += print_finite_differences_table(delta_y) + "\n"
-    results += "-" * 60 + "\n"
+    stop = n if stop is None else min(stop, n)
+    for i in range(start, stop):
+        yield "\t".join(f"{value:.4f}" for value in delta_y.row(i, max_order))
+
+
+def print_finite_differences_table(delta_y, max_rows=None, max_order=None):
+    n = len(delta_y)
+    lines = ["Таблица конечных разностей:"]
+    lines.extend(iter_finite_differences_rows(delta_y, 0, max_rows, max_order))
+    if max_rows is not None and max_rows < n:
+        lines.append(f"... показано строк: {max_rows} из {n}")
+    return "\n".join(lines) + "\n"
+
 
-    methods = [
-        ("Многочлен Лагранжа", lagrange_polynomial),
-        ("Многочлен Ньютона (раздел. разности)", newton_divided_difference_polynomial),
-        ("Многочлен Ньютона (конеч. разности)", newton_finite_difference_polynomial),
-        ("Многочлен Гаусса", gauss_polynomial)
-    ]
+def export_finite_differences(delta_y, filename, max_order=None):
+    """
+    Экспорт таблицы конечных разностей в файл без построения текста в памяти.
+
+    Формат выбирается по расширению:
+    .csv — строка таблицы на строку файла (значения с полной точностью);
+    .npz — двоичный упакованный буфер столбцов 0..max_order (массивы n, offsets, buffer).
+
+    Входные параметры:
+    delta_y   : таблица FiniteDifferenceTable
+    filename  : путь к файлу
+    max_order : наибольший экспортируемый порядок разностей (по умолчанию — все)
+    """
+    n = len(delta_y)
+    orders = n if max_order is None else min(n, max_order + 1)
+    if filename.lower().endswith(".npz"):
+        end = delta_y.offsets[orders - 1] + n - orders + 1 if orders else 0
+        np.savez(filename, n=n, offsets=delta_y.offsets[:orders], buffer=delta_y.buffer[:end])
+        return
+    with open(filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([f"d{k}" for k in range(orders)])
+        for i in range(n):
+            writer.writerow(delta_y.row(i, max_order).tolist())
+
+
+# (ключ, название, класс интерполянта)
+METHODS = [
+    ("lagrange", "Многочлен Лагранжа", LagrangeInterpolant),
+    ("newton_divided", "Многочлен Ньютона (раздел. разности)", NewtonInterpolant),
+    ("newton_finite", "Многочлен Ньютона (конеч. разности)", NewtonFiniteInterpolant),
+    ("gauss", "Многочлен Гаусса", GaussInterpolant),
+    ("chebyshev", "Ряд Чебышёва (узлы Чебышёва)", ChebyshevNodesInterpolant),
+]
+
+
+def applicable_methods(xs, n, nodes=None):
+    """
+    Выбор методов, применимых к данному набору узлов.
 
-    h = xs[1] - xs[0]
-    finite_diff_valid = all(abs(xs[i] - xs[i - 1] - h) < 1e-5 for i in range(1, n))
-    even_n = n % 2 == 0
+    Конечные разности (Ньютон и Гаусс) используются только для равноотстоящих
+    узлов. Для узлов Чебышёва вместо разделённых разностей, которые при сотнях
+    узлов теряют все значащие цифры, строится ряд Чебышёва; для остальных
+    узлов — многочлен Ньютона по разделённым разностям. Равномерность
+    проверяется по отсортированным узлам, поэтому интерполянты должны строиться
+    по тому же NodeSet (его xs и ys отсортированы).
 
-    figures = []
+    Входные параметры:
+    xs    : массив координат узлов интерполяции
+    n     : количество узлов
+    nodes : готовый NodeSet для xs[:n] (если не задан, строится здесь)
 
-    for name, method in methods:
-        if method == newton_finite_difference_polynomial and not finite_diff_valid:
+    Возвращает:
+    список кортежей (ключ, название, класс интерполянта) из METHODS
+    """
+    if nodes is None:
+        nodes = NodeSet(xs[:n])
+    finite_diff_valid = nodes.uniform
+    chebyshev_valid = not finite_diff_valid and chebyshev_interval(nodes.xs) is not None
+
+    methods = []
+    for key, name, interpolant_cls in METHODS:
+        if interpolant_cls is NewtonFiniteInterpolant and not finite_diff_valid:
+            continue
+        if interpolant_cls is NewtonInterpolant and (finite_diff_valid or chebyshev_valid):
             continue
-        if method == newton_divided_difference_polynomial and finite_diff_valid:
+        if interpolant_cls is ChebyshevNodesInterpolant and not chebyshev_valid:
             continue
-        if method == gauss_polynomial and even_n:
+        if interpolant_cls is GaussInterpolant and not finite_diff_valid:
             continue
+        methods.append((key, name, interpolant_cls))
+    return methods
 
-        y_val = method(xs, ys, n, x)
-        results += f"{name}:\nP({x}) = {y_val:.6f}\n" + "-" * 60 + "\n"
 
-        if return_plots:
-            fig = create_plot(xs, ys, x, lambda z: method(xs, ys, n, z), name)
-            figures.append(fig)
-        else:
-            draw_plot(xs, ys, x, lambda z: method(xs, ys, n, z), name)
-
-    return (results, figures) if return_plots else results
-
-
-def create_plot(xs, ys, x_point, interpolation_func, method_name):
-    x_vals = np.linspace(xs[0] - 0.1, xs[-1] + 0.1, 1000)
-    y_vals = [interpolation_func(x) for x in x_vals]
-
-    fig, ax = plt.subplots(figsize=(8, 5))
-    ax.plot(x_vals, y_vals, label=f"{method_name}", color="green")
-    ax.scatter(xs, ys, color="blue", label="Узлы интерполяции")
-    ax.scatter([x_point], [interpolation_func(x_point)], color="red", label=f"P({x_point:.3f})")
-    ax.set_title(f"Интерполяция методом: {method_name}")
-    ax.set_xlabel("x")
-    ax.set_ylabel("y")
-    ax.grid(True)
-    ax.legend()
-    fig.tight_layout()
-    return fig
+def solve(xs, ys, x, n, return_plots=False, show_plots=True, plot_dir=None, plot_format="png",
+          progress=None, cache=None, table_rows=None, table_orders=None, compensated=False, nodes=None):
+    """
+    Решение задачи интерполяции всеми применимыми методами.
+
+    Входные параметры:
+    xs, ys       : узлы интерполяции и значения функции в них (сортируются по x)
+    x            : точка интерполяции
+    n            : количество узлов
+    return_plots : вернуть графики (PlotCurve, фигура строится по запросу) вместо их показа
+    show_plots   : показать графики в окнах matplotlib (если return_plots=False)
+    plot_dir     : каталог для сохранения графиков в файлы (headless-режим)
+    plot_format  : формат файлов графиков ("png", "svg", ...)
+    progress     : функция progress(message), вызываемая после каждого этапа
+                   (исключение из неё прерывает вычисление)
+    cache        : InterpolantCache для повторного использования построенных таблиц
+                   (например, cache.default_cache); None — без кэширования
+    table_rows   : сколько строк таблицы разностей включить в отчёт (по умолчанию — все)
+    table_orders : наибольший порядок разностей в отчёте (по умолчанию — все)
+    compensated  : вычислять многочлены Лагранжа и Ньютона в компенсированной
+                   арифметике (stable.py) — медленнее, но точно при больших n
+    nodes        : готовый NodeSet для xs[:n], ys[:n] (если не задан, строится здесь)
+
+    Возвращает:
+    results или (results, curves) при return_plots=True
+    """
+    if progress is None:
+        progress = lambda message: None
+
+    with stage("dispatch"):
+        if nodes is None:
+            nodes = NodeSet(xs[:n], ys[:n])
+        if nodes.has_duplicates:
+            raise ValueError("Узлы не должны совпадать")
+        methods = applicable_methods(nodes.xs, nodes.n, nodes)
+
+    results = ""
+    if cache is None:
+        fit = lambda factory, *arrays: factory(*arrays)
+    else:
+        fit = cache.fit
+
+    with stage("finite_differences"):
+        delta_y = fit(FiniteDifferenceTable, nodes.ys)
+    with stage("table_report"):
+        results += print_finite_differences_table(delta_y, table_rows, table_orders) + "\n"
+    results += "-" * 60 + "\n"
+    progress("Построена таблица конечных разностей")
+
+    curves = []
+
+    for i, (key, name, interpolant_cls) in enumerate(methods, 1):
+        if compensated:
+            interpolant_cls = COMPENSATED_METHODS.get(key, interpolant_cls)
+        # Таблицы коэффициентов строятся один раз и переиспользуются для графика
+        with stage(f"fit:{key}"):
+            interpolant = fit(interpolant_cls, nodes)
+        with stage(f"evaluate:{key}"):
+            y_val = interpolant(x)
+        results += f"{name}:\nP({x}) = {y_val:.6f}\n" + "-" * 60 + "\n"
+        curves.append(PlotCurve(nodes.xs, nodes.ys, x, interpolant, name, key=key))
+        progress(f"{name}: готово ({i} из {len(methods)})")
+
+    if plot_dir is not None:
+        with stage("plots:save"):
+            save_plots(curves, plot_dir, plot_format)
+    if return_plots:
+        return results, curves
+    if show_plots and plot_dir is None:
+        for curve in curves:
+            draw_plot(curve)
+    return results
@@ -0,0 +1,255 @@
+"""
+Численно устойчивое вычисление интерполяционных многочленов высокой степени.
+
+Компенсированный режим хранит каждое промежуточное число парой (hi, lo)
+(арифметика двойной-двойной точности на безошибочных преобразованиях
+two_sum и two_prod): суммы накапливаются с компенсацией ошибки округления,
+произведения — с учётом младшей части. Таблицы разностей, веса и вычисление
+в точке выполняются в этой арифметике, результат округляется до float один раз.
+Это даёт около 32 значащих цифр в промежуточных вычислениях без внешних
+библиотек и остаётся векторизованным по точкам.
+
+exact_polynomial — точный эталон на fractions.Fraction для проверки.
+"""
+from fractions import Fraction
+import numpy as np
+
+from nodes import as_node_set
+
+_SPLITTER = 2.0 ** 27 + 1  # константа разбиения Деккера для float64
+
+
+def two_sum(a, b):
+    """Безошибочное сложение (Кнут): a + b = s + e точно"""
+    s = a + b
+    bb = s - a
+    e = (a - (s - bb)) + (b - bb)
+    return s, e
+
+
+def _split(a):
+    c = _SPLITTER * a
+    high = c - (c - a)
+    return high, a - high
+
+
+def two_prod(a, b):
+    """Безошибочное умножение (Деккер): a * b = p + e точно"""
+    p = a * b
+    a_high, a_low = _split(a)
+    b_high, b_low = _split(b)
+    e = a_low * b_low - (((p - a_high * b_high) - a_low * b_high) - a_high * b_low)
+    return p, e
+
+
+def _normalize(s, e):
+    hi = s + e
+    return hi, e - (hi - s)
+
+
+def _add(a, b):
+    s, e = two_sum(a[0], b[0])
+    return _normalize(s, e + (a[1] + b[1]))
+
+
+def _sub(a, b):
+    return _add(a, (-b[0], -b[1]))
+
+
+def _mul(a, b):
+    p, e = two_prod(a[0], b[0])
+    return _normalize(p, e + (a[0] * b[1] + a[1] * b[0]))
+
+
+def _div(a, b):
+    q = a[0] / b[0]
+    r = _sub(a, _mul((q, 0.0 * q), b))
+    return _normalize(q, r[0] / b[0])
+
+
+def _pair(a):
+    a = np.asarray(a, dtype=float)
+    return a, np.zeros_like(a)
+
+
+def _power_of_two_scale(xs):
+    """Множитель 2^p, приводящий разности узлов к порядку 1 (умножение на него точно)"""
+    width = np.ptp(xs) / 4
+    return 2.0 ** -np.round(np.log2(width)) if width > 0 else 1.0
+
+
+class CompensatedNewtonInterpolant:
+    """
+    Многочлен Ньютона по разделённым разностям в компенсированной арифметике.
+
+    Разделённые разности и схема Горнера выполняются парами (hi, lo);
+    разности узлов x - xs[k] представляются точно.
+    """
+
+    def __init__(self, xs, ys=None):
+        nodes = as_node_set(xs, ys)
+        self.xs, self.ys = nodes.xs, nodes.ys
+        n = nodes.n
+        coef = (self.ys.copy(), np.zeros_like(self.ys))
+        for j in range(1, n):
+            shape = (n - j,) + (1,) * (self.ys.ndim - 1)
+            step = two_sum(self.xs[j:], -self.xs[:-j])
+            step = (step[0].reshape(shape), step[1].reshape(shape))
+            num = _sub((coef[0][j:], coef[1][j:]), (coef[0][j - 1:-1], coef[1][j - 1:-1]))
+            coef[0][j:], coef[1][j:] = _div(num, step)
+        self.coef = coef
+
+    def __call__(self, x):
+        hi, lo = self.coef
+        t = np.asarray(x, dtype=float)
+        t = t.reshape(t.shape + (1,) * (hi.ndim - 1))
+        total = (hi[-1] * np.ones_like(t), lo[-1] * np.ones_like(t))
+        for k in range(len(hi) - 2, -1, -1):
+            total = _add(_mul(total, two_sum(t, -self.xs[k])), (hi[k], lo[k]))
+        return (total[0] + total[1])[()]
+
+
+class CompensatedNewtonFiniteInterpolant:
+    """
+    Многочлен Ньютона по конечным разностям в компенсированной арифметике.
+
+    Таблица разностей строится парами (hi, lo). Вместо деления на k! множитель
+    t(t-1)...(t-k+1) / k! накапливается масштабированным: на шаге k он
+    умножается на (t - k + 1) / k и остаётся порядка биномиального коэффициента.
+    """
+
+    def __init__(self, xs, ys=None):
+        nodes = as_node_set(xs, ys)
+        if not nodes.uniform:
+            raise ValueError("Метод конечных разностей требует равноотстоящих узлов")
+        self.xs, self.ys = nodes.xs, nodes.ys
+        self.h = nodes.h  # шаг
+        n = nodes.n
+        column = _pair(self.ys)
+        self.coef = [(column[0][0], column[1][0])]  # Δ^k y_0
+        for k in range(1, n):
+            column = _sub((column[0][1:], column[1][1:]), (column[0][:-1], column[1][:-1]))
+            self.coef.append((column[0][0], column[1][0]))
+
+    def __call__(self, x):
+        t = (np.asarray(x, dtype=float) - self.xs[0]) / self.h
+        t = t.reshape(t.shape + (1,) * (self.ys.ndim - 1))
+        binomial = _pair(np.ones_like(t))
+        total = _mul(binomial, self.coef[0])
+        for k in range(1, len(self.coef)):
+            factor = _div(two_sum(t, -float(k - 1)), _pair(float(k)))
+            binomial = _mul(binomial, factor)
+            total = _add(total, _mul(binomial, self.coef[k]))
+        return (total[0] + total[1])[()]
+
+
+class CompensatedLagrangeInterpolant:
+    """
+    Многочлен Лагранжа в первой барицентрической форме в компенсированной арифметике.
+
+    P(x) = l(x) * sum_i w_i y_i / (x - xs[i]), l(x) = prod_j (x - xs[j]).
+    Разности узлов умножаются на степень двойки (точно), поэтому произведения
+    в весах w_i и в l(x) не переполняются при больших n и сгущающихся узлах.
+    """
+
+    def __init__(self, xs, ys=None):
+        nodes = as_node_set(xs, ys)
+        self.xs, self.ys = nodes.xs, nodes.ys
+        self.scale = _power_of_two_scale(self.xs)
+        n = len(self.xs)
+        hi = np.empty(n)
+        lo = np.empty(n)
+        for i in range(n):
+            product = _pair(1.0)
+            for j in range(n):
+                if j != i:
+                    product = _mul(product, two_sum(self.xs[i] * self.scale, -self.xs[j] * self.scale))
+            hi[i], lo[i] = _div(_pair(1.0), product)
+        self.weights = (hi, lo)
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        shape = x.shape
+        x = x.ravel() * self.scale
+        extra = (1,) * (self.ys.ndim - 1)
+        nodes = self.xs * self.scale
+
+        node_hit = np.full(x.shape, -1)
+        total = _pair(np.zeros(x.shape + self.ys.shape[1:]))
+        product = _pair(np.ones(x.shape))
+        for i in range(len(nodes)):
+            d = two_sum(x, -nodes[i])
+            exact = d[0] == 0
+            node_hit[exact] = i
+            safe = (np.where(exact, 1.0, d[0]), np.where(exact, 0.0, d[1]))
+            product = _mul(product, safe)
+            ratio = _div((self.weights[0][i], self.weights[1][i]), safe)  # w_i / (x - xs[i])
+            ratio = (ratio[0].reshape(x.shape + extra), ratio[1].reshape(x.shape + extra))
+            total = _add(total, _mul(ratio, _pair(self.ys[i])))
+        result = _mul(total, (product[0].reshape(x.shape + extra), product[1].reshape(x.shape + extra)))
+        result = result[0] + result[1]
+        hit = node_hit >= 0
+        result[hit] = self.ys[node_hit[hit]]
+        return result.reshape(shape + self.ys.shape[1:])[()]
+
+
+def lagrange_stable(xs, ys, n, x):
+    """
+    Интерполяция по методу Лагранжа в компенсированной арифметике.
+
+    Входные параметры и результат — как у lagrange_polynomial.
+    """
+    return CompensatedLagrangeInterpolant(xs[:n], ys[:n])(x)
+
+
+def newton_divided_difference_stable(xs, ys, n, x):
+    """
+    Интерполяция многочленом Ньютона по разделённым разностям в компенсированной арифметике.
+
+    Входные параметры и результат — как у newton_divided_difference_polynomial.
+    """
+    return CompensatedNewtonInterpolant(xs[:n], ys[:n])(x)
+
+
+def newton_finite_difference_stable(xs, ys, n, x):
+    """
+    Интерполяция многочленом Ньютона по конечным разностям в компенсированной арифметике.
+
+    Входные параметры и результат — как у newton_finite_difference_polynomial.
+    """
+    return CompensatedNewtonFiniteInterpolant(xs[:n], ys[:n])(x)
+
+
+def exact_polynomial(xs, ys, n, x):
+    """
+    Точное значение интерполяционного многочлена на рациональных числах.
+
+    Узлы, значения и x переводятся в Fraction без округления, разделённые разности
+    и схема Горнера вычисляются точно, результат округляется до float один раз.
+    Медленно (вычисление по точкам на Python) — предназначено для проверки.
+
+    Входные параметры и результат — как у lagrange_polynomial (ys — одномерный массив).
+    """
+    nodes = [Fraction(float(v)) for v in xs[:n]]
+    coef = [Fraction(float(v)) for v in ys[:n]]
+    for j in range(1, n):
+        for i in range(n - 1, j - 1, -1):
+            coef[i] = (coef[i] - coef[i - 1]) / (nodes[i] - nodes[i - j])
+
+    def evaluate(point):
+        t = Fraction(float(point))
+        total = coef[-1]
+        for k in range(n - 2, -1, -1):
+            total = total * (t - nodes[k]) + coef[k]
+        return float(total)
+
+    x = np.asarray(x, dtype=float)
+    return np.vectorize(evaluate, otypes=[float])(x)[()]
+
+
+# Компенсированные замены интерполянтов по ключам solve.METHODS
+COMPENSATED_METHODS = {
+    "lagrange": CompensatedLagrangeInterpolant,
+    "newton_divided": CompensatedNewtonInterpolant,
+    "newton_finite": CompensatedNewtonFiniteInterpolant,
+}
@@ -0,0 +1,70 @@
+import numpy as np
+
+from solve import horner
+
+
+class StreamingNewtonInterpolant:
+    """
+    Многочлен Ньютона по разделённым разностям с добавлением узлов «на лету».
+
+    Хранится только последняя диагональ таблицы разделённых разностей
+    f[x_k], f[x_{k-1}, x_k], ..., f[x_0, ..., x_k] и коэффициенты многочлена
+    f[x_0], f[x_0, x_1], ..., f[x_0, ..., x_k]. Добавление узла выполняется
+    за O(n) по времени и памяти без пересчёта всей таблицы.
+    """
+
+    def __init__(self, x=None):
+        """
+        Входные параметры:
+        x : точка (или массив точек), в которой отслеживается значение многочлена
+        """
+        self.x = None if x is None else np.asarray(x, dtype=float)
+        self.xs = []
+        self.coef = []
+        self.diagonal = []
+        self.estimate = None
+        self._product = None  # prod_{j < k}(x - xs[j]) в отслеживаемой точке
+
+    def __len__(self):
+        return len(self.xs)
+
+    def add_node(self, x_new, y_new):
+        """
+        Добавляет узел (x_new, y_new) и дополняет многочлен одним членом.
+
+        Возвращает:
+        estimate   : новое значение многочлена в отслеживаемой точке (None, если точка не задана)
+        correction : модуль добавленного члена — оценка погрешности предыдущего приближения
+        """
+        x_new = float(x_new)
+        if x_new in self.xs:
+            raise ValueError("Узлы не должны совпадать")
+
+        # Новая диагональ: d_0 = y, d_j = (d_{j-1} - old_{j-1}) / (x_new - xs[k - j])
+        k = len(self.xs)
+        diagonal = [float(y_new)]
+        for j in range(1, k + 1):
+            diagonal.append((diagonal[j - 1] - self.diagonal[j - 1]) / (x_new - self.xs[k - j]))
+        self.diagonal = diagonal
+        self.coef.append(diagonal[-1])
+        self.xs.append(x_new)
+
+        if self.x is None:
+            return None, abs(diagonal[-1]) if k else 0.0
+
+        if k == 0:
+            self._product = np.ones_like(self.x)
+            self.estimate = np.full_like(self.x, diagonal[-1])
+            correction = np.zeros_like(self.x)
+        else:
+            self._product = self._product * (self.x - self.xs[k - 1])
+            term = diagonal[-1] * self._product
+            self.estimate = self.estimate + term
+            correction = np.abs(term)
+        return self.estimate[()], correction[()]
+
+    def __call__(self, x):
+        """Вычисляет значение текущего многочлена в точке x по схеме Горнера"""
+        if not self.coef:
+            raise ValueError("Нет узлов интерполяции")
+        return horner(self.coef, self.xs, x)
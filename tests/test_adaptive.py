@@ -0,0 +1,19 @@
+import numpy as np
+
+from solve import newton_adaptive
+
+
+def test_small_first_order_term_is_not_noise():
+    xs = np.linspace(0, 1, 15)
+    value, degree, error = newton_adaptive(xs, np.cos(5 * xs), 0.62, tol=1e-14)
+    assert degree > 10
+    assert abs(value - np.cos(3.1)) < 1e-10
+    assert error >= abs(value - np.cos(3.1)) / 10
+
+
+def test_noise_stops_before_last_node():
+    xs = np.linspace(0, 1, 30)
+    ys = np.exp(xs) + 1e-6 * np.random.default_rng(0).standard_normal(30)
+    value, degree, error = newton_adaptive(xs, ys, 0.99, tol=1e-15)
+    assert degree < 29
+    assert abs(value - np.exp(0.99)) < 1e-5
@@ -0,0 +1,65 @@
+import warnings
+import numpy as np
+import pytest
+
+from barycentric import BarycentricInterpolant
+from solve import LagrangeInterpolant
+
+
+def chebyshev(n, a, b):
+    return (a + b) / 2 + (b - a) / 2 * np.cos(np.pi * (2 * np.arange(n) + 1) / (2 * n))
+
+
+@pytest.mark.parametrize("n, a, b", [
+    (1000, -1.0, 1.0),
+    (3000, -1.0, 1.0),
+    (300, 0.0, 1000.0),
+    (300, 0.0, 1e-3),
+])
+def test_large_wide_and_narrow_node_sets(n, a, b):
+    f = lambda x: np.sin(5 * (x - a) / (b - a))
+    xs = chebyshev(n, a, b)
+    p = BarycentricInterpolant(xs, f(xs))
+    q = np.linspace(a, b, 101)
+    assert np.all(np.isfinite(p.weights))
+    assert np.max(np.abs(p(q) - f(q))) < 1e-12
+
+
+def test_remove_node_matches_rebuild():
+    xs = chebyshev(1000, -1.0, 1.0)
+    ys = np.sin(5 * xs)
+    p = BarycentricInterpolant(xs, ys)
+    p.remove_node(5)
+    rebuilt = BarycentricInterpolant(np.delete(xs, 5), np.delete(ys, 5))
+    np.testing.assert_allclose(p.weights, rebuilt.weights, rtol=1e-12)
+
+
+def test_exact_nodes():
+    p = BarycentricInterpolant([1.0, 2.0, 3.0], [1.0, 4.0, 9.0])
+    assert p(2.5) == pytest.approx(6.25)
+    assert p(2.0) == 4.0
+
+
+def test_add_node_matches_bulk_weights():
+    xs = chebyshev(500, -1.0, 1.0)
+    p = BarycentricInterpolant()
+    for x in xs:
+        p.add_node(x, 0.0)
+    np.testing.assert_allclose(p.weights, BarycentricInterpolant(xs, np.zeros(500)).weights, rtol=1e-12)
+
+
+def test_lagrange_interpolant_many_nodes():
+    xs = chebyshev(600, 0.0, 1.0)
+    ys = np.column_stack([np.sin(xs), np.cos(xs)])
+    p = LagrangeInterpolant(xs, ys)
+    q = np.linspace(0.0, 1.0, 101)
+    expected = np.column_stack([np.sin(q), np.cos(q)])
+    assert np.max(np.abs(p(q) - expected)) < 1e-12
+    assert np.max(np.abs(p.basis(q) @ p.ys - expected)) < 1e-12
+    assert np.max(np.abs(LagrangeInterpolant(xs, ys[:, 0])(q) - expected[:, 0])) < 1e-12
+
+
+def test_two_nodes_exact_hit_has_no_warning():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert LagrangeInterpolant([1.0, 2.0], [3.0, 5.0])(np.array([1.0, 1.5, 2.0])).tolist() == [3.0, 4.0, 5.0]
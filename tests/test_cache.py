@@ -0,0 +1,36 @@
+from types import SimpleNamespace
+import numpy as np
+
+from cache import InterpolantCache, _nbytes
+from difftable import FiniteDifferenceTable
+from solve import GaussInterpolant
+
+
+def test_nbytes_counts_nested_tables():
+    xs = np.linspace(0, 1, 1000)
+    holder = SimpleNamespace(tables={"sin": [FiniteDifferenceTable(np.sin(xs))]})
+    assert _nbytes(holder) >= holder.tables["sin"][0].buffer.nbytes
+
+
+def test_gauss_does_not_keep_the_table():
+    xs = np.linspace(0, 1, 1000)
+    interpolant = GaussInterpolant(xs, np.sin(xs))
+    interpolant(xs[::7])
+    assert _nbytes(interpolant) < 100 * xs.nbytes
+
+
+def test_max_bytes_evicts_large_entries():
+    xs = np.linspace(0, 1, 1000)
+    cache = InterpolantCache(max_bytes=1_000_000)
+    for i in range(5):
+        cache.fit(FiniteDifferenceTable, np.sin(xs) + i)
+    assert len(cache) == 1
+
+
+def test_same_name_in_different_modules():
+    first = type("Table", (), {"__init__": lambda self, ys: None, "__module__": "first"})
+    second = type("Table", (), {"__init__": lambda self, ys: None, "__module__": "second"})
+    cache = InterpolantCache()
+    ys = np.arange(3.0)
+    assert isinstance(cache.fit(first, ys), first)
+    assert isinstance(cache.fit(second, ys), second)
@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from batch import solve_batch
+from chebyshev import chebyshev_interval, chebyshev_nodes
+
+
+@pytest.mark.parametrize("kind", [1, 2])
+def test_interval_is_recovered(kind):
+    xs = chebyshev_nodes(-2.0, 3.0, 50, kind)
+    a, b, found = chebyshev_interval(xs)
+    assert found == kind
+    assert a == pytest.approx(-2.0) and b == pytest.approx(3.0)
+    assert chebyshev_interval(np.linspace(-2.0, 3.0, 50) ** 3) is None
+
+
+@pytest.mark.parametrize("n", [200, 600])
+def test_chebyshev_nodes_use_stable_methods(n):
+    xs = chebyshev_nodes(0.0, 1.0, n)
+    q = np.linspace(0.0, 1.0, 11)
+    result = solve_batch([xs], [np.sin(xs)], q, processes=0)[0]
+    assert np.all(np.isnan(result["newton_divided"]))
+    for key in ("lagrange", "chebyshev"):
+        assert np.max(np.abs(result[key] - np.sin(q))) < 1e-12
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from solve import GaussInterpolant, LagrangeInterpolant
+
+EPS = np.finfo(float).eps
+
+
+def assert_matches_lagrange(xs, ys, x):
+    lagrange = LagrangeInterpolant(xs, ys)
+    # Допуск — несколько ulp от sum |l_i(x) y_i|: в узлах и между ними это порядка |P(x)|,
+    # вне узлов учитывается рост обусловленности с n
+    scale = np.sum(np.abs(lagrange.basis(x) * lagrange.ys), axis=-1)
+    assert np.all(np.abs(GaussInterpolant(xs, ys)(x) - lagrange(x)) <= 4 * EPS * scale)
+
+
+@pytest.mark.parametrize("n", range(1, 22))
+def test_auto_matches_lagrange(n):
+    xs = np.linspace(1.0, 2.0, n)
+    ys = np.exp(xs)
+    h = xs[1] - xs[0] if n > 1 else 1.0
+    # Обе стороны от центрального узла во всех областях выбора формулы
+    t = np.array([-0.9, -0.6, -0.4, -0.25, -0.1, 0.0, 0.1, 0.25, 0.4, 0.6, 0.9])
+    assert_matches_lagrange(xs, ys, xs[(n - 1) // 2] + h * t)
+    assert_matches_lagrange(xs, ys, xs)
+    assert_matches_lagrange(xs, ys, np.array([xs[0] - 1.5 * h, xs[0] - 0.5 * h, xs[-1] + 0.5 * h, xs[-1] + 1.5 * h]))
+
+
+def test_auto_matches_lagrange_for_several_functions():
+    xs = np.linspace(-1.0, 1.0, 10)
+    ys = np.column_stack([np.sin(3 * xs), np.cos(xs)])
+    x = np.linspace(-1.2, 1.2, 49)
+    np.testing.assert_allclose(GaussInterpolant(xs, ys)(x), LagrangeInterpolant(xs, ys)(x), rtol=1e-13, atol=1e-14)
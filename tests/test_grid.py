@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from grid import GRID_METHODS, NEWTON_MAX_WINDOW, GridInterpolant
+
+
+@pytest.mark.parametrize("method", GRID_METHODS)
+def test_local_windows_match_function(method):
+    x = np.linspace(0.0, 3.0, 40)
+    values = np.cos(x)[:, None] * np.sin(x)
+    points = np.random.default_rng(0).random((200, 2)) * 3.0
+    p = GridInterpolant([x, x], values, k=8, method=method)
+    expected = np.cos(points[:, 0]) * np.sin(points[:, 1])
+    assert np.max(np.abs(p(points) - expected)) < 1e-9
+
+
+@pytest.mark.parametrize("method", ["newton_divided", "newton_finite"])
+@pytest.mark.parametrize("k", [None, NEWTON_MAX_WINDOW + 1])
+def test_newton_rejects_large_windows(method, k):
+    x = np.linspace(0.0, 3.0, 40)
+    with pytest.raises(ValueError):
+        GridInterpolant([x, x], np.zeros((40, 40)), k=k, method=method)
@@ -0,0 +1,39 @@
+import pytest
+
+from batch import solve_batch
+from nodes import NodeSet
+from solve import GaussInterpolant, NewtonFiniteInterpolant, applicable_methods, solve
+
+XS = [0.0, 2.0, 1.0, 3.0]
+YS = [x ** 3 for x in XS]
+
+
+def test_unsorted_nodes_are_sorted_before_finite_differences():
+    results = solve(XS, YS, 1.5, len(XS), show_plots=False)
+    assert results.count("P(1.5) = 3.375000") == 3
+
+
+def test_unsorted_nodes_in_batch():
+    row = solve_batch([XS], [YS], [1.5], processes=0)[0, 0]
+    for key in ("lagrange", "newton_finite", "gauss"):
+        assert row[key] == pytest.approx(3.375)
+
+
+def test_interpolants_use_node_set():
+    nodes = NodeSet(XS, YS)
+    assert [key for key, _, _ in applicable_methods(nodes.xs, nodes.n, nodes)] == \
+        ["lagrange", "newton_finite", "gauss"]
+    for cls in (NewtonFiniteInterpolant, GaussInterpolant):
+        interpolant = cls(nodes)
+        assert interpolant.h == nodes.h
+        assert interpolant(1.5) == pytest.approx(3.375)
+
+
+def test_finite_differences_reject_nonuniform_nodes():
+    with pytest.raises(ValueError):
+        NewtonFiniteInterpolant([0.0, 1.0, 3.0], [0.0, 1.0, 27.0])
+
+
+def test_duplicate_nodes_rejected():
+    with pytest.raises(ValueError):
+        solve([0.0, 1.0, 1.0], [0.0, 1.0, 2.0], 0.5, 3, show_plots=False)
@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+from piecewise import CubicSpline, solve_tridiagonal
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 8, 37])
+def test_solve_tridiagonal_matches_dense(n):
+    rng = np.random.default_rng(n)
+    lower, upper, rhs = rng.random(n), rng.random(n), rng.random(n)
+    diag = 3.0 + rng.random(n)
+    matrix = np.diag(diag) + np.diag(lower[1:], -1) + np.diag(upper[:-1], 1)
+    np.testing.assert_allclose(solve_tridiagonal(lower, diag, upper, rhs), np.linalg.solve(matrix, rhs))
+
+
+def test_natural_spline_interpolates():
+    xs = np.linspace(0.0, 1.0, 1001)
+    spline = CubicSpline(xs, np.sin(xs))
+    assert np.array_equal(spline(xs[:-1]), np.sin(xs[:-1]))
+    q = np.linspace(0.0, 1.0, 777)
+    assert np.max(np.abs(spline(q) - np.sin(q))) < 1e-7